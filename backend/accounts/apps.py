@@ -9,8 +9,4 @@ class AccountsConfig(AppConfig):
     """Configuration for the accounts app."""
     
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'accounts'
-    
-    def ready(self):
-        """Import signals when the app is ready."""
-        import accounts.signals  # noqa 
\ No newline at end of file
+    name = 'accounts' 
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Move the frequently read preferences from UserPreferences onto User.
+
+The values are copied across for existing rows before the old columns
+are dropped.
+"""
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+HOT_FIELDS = [
+    'items_per_page',
+    'default_view',
+    'low_stock_alerts',
+    'order_status_notifications',
+    'inventory_count_reminders',
+]
+
+
+def copy_to_user(apps, schema_editor):
+    """Copy the hot preference values onto their users."""
+    User = apps.get_model('accounts', 'User')
+    UserPreferences = apps.get_model('accounts', 'UserPreferences')
+
+    preferences = UserPreferences.objects.filter(user=OuterRef('pk'))
+    User.objects.filter(preferences__isnull=False).update(**{
+        field: Subquery(preferences.values(field)[:1])
+        for field in HOT_FIELDS
+    })
+
+
+def copy_to_preferences(apps, schema_editor):
+    """Copy the hot preference values back onto UserPreferences."""
+    User = apps.get_model('accounts', 'User')
+    UserPreferences = apps.get_model('accounts', 'UserPreferences')
+
+    users = User.objects.filter(pk=OuterRef('user_id'))
+    UserPreferences.objects.update(**{
+        field: Subquery(users.values(field)[:1])
+        for field in HOT_FIELDS
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='items_per_page',
+            field=models.PositiveIntegerField(default=20, verbose_name='Items Per Page'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='default_view',
+            field=models.CharField(choices=[('list', 'List'), ('grid', 'Grid'), ('calendar', 'Calendar')], default='list', max_length=50, verbose_name='Default View'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='low_stock_alerts',
+            field=models.BooleanField(default=True, verbose_name='Low Stock Alerts'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='order_status_notifications',
+            field=models.BooleanField(default=True, verbose_name='Order Status Notifications'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='inventory_count_reminders',
+            field=models.BooleanField(default=True, verbose_name='Inventory Count Reminders'),
+        ),
+        migrations.RunPython(copy_to_user, copy_to_preferences),
+        migrations.RemoveField(
+            model_name='userpreferences',
+            name='items_per_page',
+        ),
+        migrations.RemoveField(
+            model_name='userpreferences',
+            name='default_view',
+        ),
+        migrations.RemoveField(
+            model_name='userpreferences',
+            name='low_stock_alerts',
+        ),
+        migrations.RemoveField(
+            model_name='userpreferences',
+            name='order_status_notifications',
+        ),
+        migrations.RemoveField(
+            model_name='userpreferences',
+            name='inventory_count_reminders',
+        ),
+    ]
@@ -0,0 +1,65 @@
+"""
+Fold the remaining UserPreferences columns into a JSON column on User.
+
+The reverse accessor of the old one-to-one is dropped first so the new
+User.preferences field doesn't clash with it while the data is copied.
+"""
+
+import accounts.models
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import JSONObject
+
+
+PREFERENCE_FIELDS = ['date_format', 'time_format', 'timezone']
+
+
+def copy_to_user(apps, schema_editor):
+    """Copy each UserPreferences row into its user's preferences JSON."""
+    User = apps.get_model('accounts', 'User')
+    UserPreferences = apps.get_model('accounts', 'UserPreferences')
+
+    preferences = UserPreferences.objects.filter(user=OuterRef('pk')).values(
+        data=JSONObject(**{field: field for field in PREFERENCE_FIELDS})
+    )
+    User.objects.filter(
+        pk__in=UserPreferences.objects.values('user')
+    ).update(preferences=Subquery(preferences[:1]))
+
+
+def copy_to_preferences(apps, schema_editor):
+    """Recreate UserPreferences rows from the users' preferences JSON."""
+    User = apps.get_model('accounts', 'User')
+    UserPreferences = apps.get_model('accounts', 'UserPreferences')
+
+    UserPreferences.objects.bulk_create([
+        UserPreferences(user_id=user.pk, **{
+            field: user.preferences[field]
+            for field in PREFERENCE_FIELDS if field in user.preferences
+        })
+        for user in User.objects.only('pk', 'preferences').iterator()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_move_hot_preferences_to_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userpreferences',
+            name='user',
+            field=models.OneToOneField(on_delete=models.deletion.CASCADE, related_name='+', to='accounts.user'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='preferences',
+            field=models.JSONField(blank=True, default=accounts.models.default_preferences, verbose_name='Preferences'),
+        ),
+        migrations.RunPython(copy_to_user, copy_to_preferences),
+        migrations.DeleteModel(
+            name='UserPreferences',
+        ),
+    ]
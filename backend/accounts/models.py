@@ -3,9 +3,28 @@ Models for the accounts app.
 """
 
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
+from django.contrib.postgres.indexes import GinIndex
 from django.utils.translation import gettext_lazy as _
 
+# Lazy, so it still resolves against the active language when rendered
+_EMPTY_LOC = _("No location set")
+
+
+def default_preferences():
+    """Return the default contents of User.preferences."""
+    return {
+        "date_format": "MM/DD/YYYY",
+        "time_format": "12-hour",
+        "timezone": "UTC",
+    }
+
+
+class UserManager(BaseUserManager):
+    """
+    Manager for the custom User model.
+    """
+
 
 class User(AbstractUser):
     """
@@ -30,41 +49,8 @@ class User(AbstractUser):
     notification_sms = models.BooleanField(_("SMS Notifications"), default=False)
     dark_mode = models.BooleanField(_("Dark Mode"), default=False)
     
-    # Business-related fields
-    company_name = models.CharField(_("Company Name"), max_length=255, blank=True)
-    location = models.CharField(_("Location"), max_length=255, blank=True)
-    
-    # Date fields
-    date_updated = models.DateTimeField(_("Date Updated"), auto_now=True)
-    
-    class Meta:
-        verbose_name = _("User")
-        verbose_name_plural = _("Users")
-        ordering = ["username"]
-    
-    def __str__(self):
-        """Return the user's full name or username."""
-        return self.get_full_name() or self.username
-    
-    def get_location_display(self):
-        """Return formatted location if available."""
-        return self.location if self.location else _("No location set")
-
-
-class UserPreferences(models.Model):
-    """
-    Additional user preferences for the application.
-    
-    Separated from User model to keep it clean and focused.
-    """
-    
-    user = models.OneToOneField(
-        User,
-        on_delete=models.CASCADE,
-        related_name="preferences"
-    )
-    
-    # Interface preferences
+    # Hot preferences read on most requests; kept on the user row so they
+    # come along with request.user instead of needing a join
     items_per_page = models.PositiveIntegerField(_("Items Per Page"), default=20)
     default_view = models.CharField(
         _("Default View"),
@@ -76,21 +62,40 @@ class UserPreferences(models.Model):
         ],
         default="list"
     )
-    
-    # Notification settings
     low_stock_alerts = models.BooleanField(_("Low Stock Alerts"), default=True)
     order_status_notifications = models.BooleanField(_("Order Status Notifications"), default=True)
     inventory_count_reminders = models.BooleanField(_("Inventory Count Reminders"), default=True)
     
-    # Date and time preferences
-    date_format = models.CharField(_("Date Format"), max_length=20, default="MM/DD/YYYY")
-    time_format = models.CharField(_("Time Format"), max_length=20, default="12-hour")
-    timezone = models.CharField(_("Timezone"), max_length=50, default="UTC")
+    # Rarely read display settings (date_format, time_format, timezone)
+    preferences = models.JSONField(_("Preferences"), default=default_preferences, blank=True)
+    
+    # Business-related fields
+    company_name = models.CharField(_("Company Name"), max_length=255, blank=True)
+    location = models.CharField(_("Location"), max_length=255, blank=True)
+    
+    # Date fields
+    date_updated = models.DateTimeField(_("Date Updated"), auto_now=True)
+    
+    objects = UserManager()
     
     class Meta:
-        verbose_name = _("User Preferences")
-        verbose_name_plural = _("User Preferences")
+        verbose_name = _("User")
+        verbose_name_plural = _("Users")
+        ordering = ["username"]
+        indexes = [
+            # Backs the admin's substring (ILIKE) search on these columns
+            GinIndex(
+                name="user_trgm_idx",
+                fields=["first_name", "last_name", "email", "company_name"],
+                opclasses=["gin_trgm_ops"] * 4,
+            ),
+        ]
     
     def __str__(self):
-        """Return the associated user's username."""
-        return f"{self.user.username}'s preferences" 
\ No newline at end of file
+        """Return the user's full name or username."""
+        return self.get_full_name() or self.username
+    
+    def get_location_display(self):
+        """Return formatted location if available."""
+        return self.location if self.location else _EMPTY_LOC
+
@@ -1,25 +1,28 @@
 """
 Tests for the accounts app API endpoints.
 """
-from django.urls import reverse
+from django.urls import reverse, reverse_lazy
 from rest_framework import status
 from django.contrib.auth import get_user_model
-from accounts.models import UserPreferences
 from core.tests.test_base import BaseAPITestCase
 
 User = get_user_model()
 
+USER_LIST_URL = reverse_lazy('api:user-list')
+LOGIN_URL = reverse_lazy('api:token_obtain_pair')
+
 
 class UserAPITests(BaseAPITestCase):
     """Tests for the User API endpoints."""
     
-    def setUp(self):
-        """Set up for test case."""
-        super().setUp()
-        self.user_list_url = reverse('api:user-list')
-        self.admin_detail_url = reverse('api:user-detail', args=[self.admin_user.id])
-        self.regular_user_detail_url = reverse('api:user-detail', args=[self.regular_user.id])
-        self.login_url = reverse('api:token_obtain_pair')
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data for the whole TestCase."""
+        super().setUpTestData()
+        cls.user_list_url = str(USER_LIST_URL)
+        cls.admin_detail_url = reverse('api:user-detail', args=[cls.admin_user.id])
+        cls.regular_user_detail_url = reverse('api:user-detail', args=[cls.regular_user.id])
+        cls.login_url = str(LOGIN_URL)
     
     def test_login_with_valid_credentials(self):
         """Test that a user can login with valid credentials."""
@@ -49,7 +52,9 @@ class UserAPITests(BaseAPITestCase):
         """Test that admin can list all users."""
         self.authenticate_as_admin()
         
-        response = self.client.get(self.user_list_url)
+        # One COUNT for pagination and one SELECT for the page
+        with self.assertNumQueries(2):
+            response = self.client.get(self.user_list_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(response.data['results']), 2)  # At least admin and regular user
@@ -100,7 +105,10 @@ class UserAPITests(BaseAPITestCase):
             'last_name': 'User',
         }
         
-        response = self.client.post(self.user_list_url, payload)
+        # Username uniqueness check, then the user INSERT; the preferences
+        # are a column of the user row
+        with self.assertNumQueries(2):
+            response = self.client.post(self.user_list_url, payload)
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['username'], payload['username'])
@@ -136,7 +144,9 @@ class UserAPITests(BaseAPITestCase):
             'last_name': 'Name',
         }
         
-        response = self.client.patch(self.regular_user_detail_url, payload)
+        # User SELECT (joined with preferences) and the UPDATE
+        with self.assertNumQueries(2):
+            response = self.client.patch(self.regular_user_detail_url, payload)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['first_name'], payload['first_name'])
@@ -204,13 +214,14 @@ class UserAPITests(BaseAPITestCase):
 
 
 class UserPreferencesAPITests(BaseAPITestCase):
-    """Tests for the UserPreferences API endpoints."""
+    """Tests for the user preferences API endpoints."""
     
-    def setUp(self):
-        """Set up for test case."""
-        super().setUp()
-        self.admin_preferences_url = reverse('api:user-preferences', args=[self.admin_user.id])
-        self.regular_user_preferences_url = reverse('api:user-preferences', args=[self.regular_user.id])
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data for the whole TestCase."""
+        super().setUpTestData()
+        cls.admin_preferences_url = reverse('api:user-preferences', args=[cls.admin_user.id])
+        cls.regular_user_preferences_url = reverse('api:user-preferences', args=[cls.regular_user.id])
     
     def test_get_own_preferences(self):
         """Test that a user can get their own preferences."""
@@ -249,7 +260,9 @@ class UserPreferencesAPITests(BaseAPITestCase):
             'low_stock_alerts': False,
         }
         
-        response = self.client.patch(self.regular_user_preferences_url, payload)
+        # User SELECT and the UPDATE of the user row
+        with self.assertNumQueries(2):
+            response = self.client.patch(self.regular_user_preferences_url, payload)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['items_per_page'], payload['items_per_page'])
@@ -257,10 +270,10 @@ class UserPreferencesAPITests(BaseAPITestCase):
         self.assertEqual(response.data['low_stock_alerts'], payload['low_stock_alerts'])
         
         # Verify the preferences were updated in the database
-        self.regular_user.preferences.refresh_from_db()
-        self.assertEqual(self.regular_user.preferences.items_per_page, payload['items_per_page'])
-        self.assertEqual(self.regular_user.preferences.default_view, payload['default_view'])
-        self.assertEqual(self.regular_user.preferences.low_stock_alerts, payload['low_stock_alerts'])
+        self.regular_user.refresh_from_db()
+        self.assertEqual(self.regular_user.items_per_page, payload['items_per_page'])
+        self.assertEqual(self.regular_user.default_view, payload['default_view'])
+        self.assertEqual(self.regular_user.low_stock_alerts, payload['low_stock_alerts'])
     
     def test_update_another_user_preferences_as_regular_user(self):
         """Test that a regular user cannot update another user's preferences."""
@@ -276,8 +289,8 @@ class UserPreferencesAPITests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         
         # Verify the preferences were not updated in the database
-        self.admin_user.preferences.refresh_from_db()
-        self.assertNotEqual(self.admin_user.preferences.items_per_page, payload['items_per_page'])
+        self.admin_user.refresh_from_db()
+        self.assertNotEqual(self.admin_user.items_per_page, payload['items_per_page'])
     
     def test_update_another_user_preferences_as_admin(self):
         """Test that an admin can update another user's preferences."""
@@ -293,6 +306,6 @@ class UserPreferencesAPITests(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Verify the preferences were updated in the database
-        self.regular_user.preferences.refresh_from_db()
-        self.assertEqual(self.regular_user.preferences.items_per_page, payload['items_per_page'])
-        self.assertEqual(self.regular_user.preferences.default_view, payload['default_view']) 
\ No newline at end of file
+        self.regular_user.refresh_from_db()
+        self.assertEqual(self.regular_user.items_per_page, payload['items_per_page'])
+        self.assertEqual(self.regular_user.default_view, payload['default_view']) 
\ No newline at end of file
@@ -4,7 +4,7 @@ Tests for the accounts app models.
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.db.utils import IntegrityError
-from accounts.models import UserPreferences
+from accounts.models import default_preferences
 from core.tests.test_base import BaseTestCase
 
 User = get_user_model()
@@ -58,6 +58,20 @@ class UserModelTests(BaseTestCase):
         
         self.assertEqual(str(user), "testuser2")
     
+    def test_user_string_representation_follows_changes(self):
+        """Test that the string representation reflects unsaved name changes."""
+        user = User.objects.create_user(
+            username="testuser5",
+            email="test5@example.com",
+            password="testpass123"
+        )
+        self.assertEqual(str(user), "testuser5")
+        
+        user.first_name = "Test5"
+        user.last_name = "User5"
+        
+        self.assertEqual(str(user), "Test5 User5")
+    
     def test_email_is_normalized(self):
         """Test that the email address is normalized when creating a user."""
         email = "test3@EXAMPLE.com"
@@ -95,73 +109,78 @@ class UserModelTests(BaseTestCase):
 
 
 class UserPreferencesTests(BaseTestCase):
-    """Tests for the UserPreferences model."""
+    """Tests for the user preference fields."""
     
     def test_user_preferences_created_with_user(self):
-        """Test that UserPreferences are created when a user is created."""
+        """Test that a new user gets the default preferences."""
         user = User.objects.create_user(
             username="prefuser",
             email="pref@example.com",
             password="testpass123"
         )
         
-        # Verify UserPreferences was created
-        preferences = UserPreferences.objects.filter(user=user).first()
-        self.assertIsNotNone(preferences)
+        user.refresh_from_db()
+        self.assertEqual(user.preferences, default_preferences())
     
     def test_preferences_default_values(self):
-        """Test the default values of UserPreferences."""
+        """Test the default values of the user preferences."""
         user = User.objects.create_user(
             username="prefuser2",
             email="pref2@example.com",
             password="testpass123"
         )
         
-        preferences = user.preferences
-        
         # Check default values
-        self.assertEqual(preferences.items_per_page, 20)
-        self.assertEqual(preferences.default_view, "list")
-        self.assertTrue(preferences.low_stock_alerts)
-        self.assertTrue(preferences.order_status_notifications)
-        self.assertTrue(preferences.inventory_count_reminders)
-        self.assertEqual(preferences.date_format, "MM/DD/YYYY")
-        self.assertEqual(preferences.time_format, "12-hour")
-        self.assertEqual(preferences.timezone, "UTC")
-    
-    def test_preferences_string_representation(self):
-        """Test the string representation of UserPreferences."""
-        user = User.objects.create_user(
-            username="prefuser3",
-            email="pref3@example.com",
-            password="testpass123"
-        )
-        
-        preferences = user.preferences
-        self.assertEqual(str(preferences), "prefuser3's preferences")
+        self.assertEqual(user.items_per_page, 20)
+        self.assertEqual(user.default_view, "list")
+        self.assertTrue(user.low_stock_alerts)
+        self.assertTrue(user.order_status_notifications)
+        self.assertTrue(user.inventory_count_reminders)
+        self.assertEqual(user.preferences["date_format"], "MM/DD/YYYY")
+        self.assertEqual(user.preferences["time_format"], "12-hour")
+        self.assertEqual(user.preferences["timezone"], "UTC")
     
     def test_preferences_update(self):
-        """Test updating UserPreferences."""
+        """Test updating the user preferences."""
         user = User.objects.create_user(
             username="prefuser4",
             email="pref4@example.com",
             password="testpass123"
         )
         
-        preferences = user.preferences
-        
         # Update preferences
-        preferences.items_per_page = 50
-        preferences.default_view = "grid"
-        preferences.low_stock_alerts = False
-        preferences.date_format = "DD/MM/YYYY"
-        preferences.save()
+        user.items_per_page = 50
+        user.default_view = "grid"
+        user.low_stock_alerts = False
+        user.preferences["date_format"] = "DD/MM/YYYY"
+        user.save()
         
         # Refresh from database
-        preferences.refresh_from_db()
+        user.refresh_from_db()
         
         # Check updated values
-        self.assertEqual(preferences.items_per_page, 50)
-        self.assertEqual(preferences.default_view, "grid")
-        self.assertFalse(preferences.low_stock_alerts)
-        self.assertEqual(preferences.date_format, "DD/MM/YYYY") 
\ No newline at end of file
+        self.assertEqual(user.items_per_page, 50)
+        self.assertEqual(user.default_view, "grid")
+        self.assertFalse(user.low_stock_alerts)
+        self.assertEqual(user.preferences["date_format"], "DD/MM/YYYY")
+    
+    def test_user_creation_query_count(self):
+        """Test that creating a user, preferences included, is a single INSERT."""
+        with self.assertNumQueries(1):
+            User.objects.create_user(
+                username="prefuser5",
+                email="pref5@example.com",
+                password="testpass123"
+            )
+    
+    def test_user_save_query_count(self):
+        """Test that saving an existing user is a single UPDATE."""
+        user = User.objects.create_user(
+            username="prefuser6",
+            email="pref6@example.com",
+            password="testpass123"
+        )
+        user.first_name = "Updated"
+        
+        with self.assertNumQueries(1):
+            user.save()
@@ -0,0 +1,21 @@
+"""
+API app configuration.
+"""
+
+from django.apps import AppConfig, apps
+
+
+class ApiConfig(AppConfig):
+    """Configuration for the api app."""
+    
+    name = 'api'
+    
+    def ready(self):
+        """Resolve every model's owner field up front and connect cache signals."""
+        from .permissions import OWNERSHIP_FIELDS, get_owner_attname
+        import api.cache  # noqa
+        
+        # Called exactly as is_owner() calls it, so object permission checks
+        # only ever hit the warm cache
+        for model in apps.get_models():
+            get_owner_attname(model, OWNERSHIP_FIELDS)
@@ -0,0 +1,98 @@
+"""
+Response caching for the API's read-mostly endpoints.
+"""
+
+from functools import partial
+from hashlib import sha1
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.response import Response
+
+from inventory.models import Category, Supplier, Location, Product, InventoryItem, Order
+
+# Cached resource -> models whose writes change its responses, including the
+# rows behind its filters: product writes update the category and supplier
+# product counts with queryset.update(), which sends no signal of its own
+CACHED_RESOURCES = {
+    'categories': (Category, Product),
+    'suppliers': (Supplier, Product, Order),
+    'locations': (Location, InventoryItem),
+    'products': (Product, Category, Supplier, InventoryItem),
+}
+
+
+def get_generation(resource):
+    """
+    Return the current cache generation of a resource.
+    
+    Response keys include it, so replacing it drops all of the resource's
+    cached responses at once, on any cache backend.
+    """
+    return cache.get_or_set(f'api:{resource}:generation', lambda: uuid4().hex, None)
+
+
+def invalidate(resource):
+    """
+    Start a new cache generation for a resource.
+    """
+    cache.delete(f'api:{resource}:generation')
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Supplier)
+@receiver([post_save, post_delete], sender=Location)
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=InventoryItem)
+@receiver([post_save, post_delete], sender=Order)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Drop the cached responses that depend on a saved or deleted row.
+    
+    The responses are dropped once the write is committed; dropping them
+    earlier would let a concurrent request cache the data from before it.
+    
+    Args:
+        sender: The model class of the row
+        **kwargs: Additional keyword arguments
+    """
+    for resource, models in CACHED_RESOURCES.items():
+        if sender in models:
+            transaction.on_commit(partial(invalidate, resource))
+
+
+class CachedReadMixin:
+    """
+    ViewSet mixin caching the data of list and retrieve responses.
+    
+    Responses are cached per absolute URL, so per host, path and query
+    string, for API_CACHE_TIMEOUT seconds or until a model listed for
+    cache_resource in CACHED_RESOURCES changes. Permissions are still
+    checked on every request; only successful responses are cached.
+    """
+    cache_resource = None
+    
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+    
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+    
+    def cached_response(self, view, request, *args, **kwargs):
+        """
+        Return the cached data for the request, or call view and cache its data.
+        """
+        url = sha1(request.build_absolute_uri().encode()).hexdigest()
+        key = f'api:{self.cache_resource}:{get_generation(self.cache_resource)}:{url}'
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        return response
@@ -5,333 +5,84 @@ This module contains documentation about API features, including filtering, sort
 These docs are designed to be included in the Swagger/OpenAPI documentation.
 """
 
+from functools import cache
+from pathlib import Path
+
 from drf_spectacular.utils import extend_schema_field, extend_schema_serializer, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
 from rest_framework import serializers
 
-# Field Validation Documentation
-
-VALIDATION_DOCS = """
-# Field Validation
-
-The CocktailAI API implements robust field validation to ensure data integrity.
-This document outlines the validation rules applied to different field types.
-
-## Date Validation
-
-### No Future Dates
-
-Many date fields cannot accept dates in the future:
-
-- `order_date` in Order
-- `actual_delivery_date` in Order
-- `completed_date` in InventoryCount
-- `counted_at` in InventoryCountItem
-- `transaction_date` in InventoryTransaction
-
-Example error response:
-```json
-{
-  "order_date": ["2024-12-31 is in the future. This field cannot accept future dates."]
-}
-```
-
-### Date Sequence Validation
-
-Date fields that represent a sequence of events are validated to ensure logical order:
-
-- In Order model: `expected_delivery_date` and `actual_delivery_date` cannot be before `order_date`
-- In InventoryCount model: `scheduled_date` cannot be after `completed_date`
-
-Example error response:
-```json
-{
-  "expected_delivery_date": ["Expected delivery date cannot be before the order date."]
-}
-```
-
-## Contact Information Validation
+# The documentation itself lives in Markdown files next to this module and is
+# only read the first time it is needed, then kept for the process lifetime.
 
-### Email Validation
-
-Email fields are validated for proper format:
-
-- `email` in Supplier model
-- `email` in User model
-
-Example error response:
-```json
-{
-  "email": ["invalid-email is not a valid email address."]
-}
-```
-
-### Phone Number Validation
-
-Phone numbers are validated for proper format and length:
-
-- `phone` in Supplier model
-- `phone_number` in User model
-
-Format accepts international codes, parentheses, spaces, and hyphens. Must have between 7-15 digits.
-
-Example error response:
-```json
-{
-  "phone": ["12345 is not a valid phone number. Must have between 7 and 15 digits."]
-}
-```
-
-## Numeric Value Validation
-
-### Currency/Price Validation
-
-All price and currency fields must be non-negative:
-
-- `unit_price` in Product model
-- `shipping_cost`, `tax`, `discount` in Order model
-- `unit_price` in OrderItem model
-
-Example error response:
-```json
-{
-  "unit_price": ["Value cannot be less than 0."]
-}
-```
+DOCUMENTATION_DIR = Path(__file__).resolve().parent / 'documentation'
 
-### Quantity Validation
 
-Quantity fields have specific validation rules:
-
-- Most quantity fields must be non-negative
-- For InventoryTransaction, the sign depends on transaction_type:
-  - Positive for 'received' transactions
-  - Negative for 'sold' and 'transferred' transactions
-
-Example error response:
-```json
-{
-  "quantity": ["Quantity must be negative for sold transactions."]
-}
-```
-
-## Transaction-Specific Validation
-
-InventoryTransaction model has specialized validation:
+def read_documentation(name):
+    """
+    Read a Markdown documentation file from the documentation directory.
+    """
+    return (DOCUMENTATION_DIR / f"{name}.md").read_text(encoding='utf-8')
 
-- For 'transferred' transactions, destination_location is required
-- destination_location must be different from source location
-- Quantity sign must match transaction type (positive/negative)
+# Field Validation Documentation
 
-Example error response:
-```json
-{
-  "destination_location": ["Destination location is required for transfers."]
-}
-```
-"""
+@cache
+def get_validation_docs():
+    """
+    Get the field validation documentation.
+    """
+    return read_documentation('validation')
 
 # Filtering Documentation
 
-FILTERING_DOCS = """
-# Filtering
-
-The CocktailAI API supports advanced filtering capabilities across all endpoints. 
-Filters can be applied as query parameters to narrow down results.
-
-## Basic Filtering
-
-Basic filtering can be done by providing exact match parameters:
-
-```
-/api/products/?category=1&is_active=true
-```
-
-## Advanced Filtering
-
-Many endpoints support advanced filtering options:
-
-### Range Filters
-
-Range filters allow filtering by numeric ranges:
-
-```
-/api/products/?min_price=10&max_price=50
-/api/inventory-items/?min_quantity=5&max_quantity=100
-```
-
-### Date Filters
-
-Date filters allow filtering by date ranges:
-
-```
-/api/orders/?created_after=2023-01-01&created_before=2023-12-31
-/api/inventory-transactions/?created_after=2023-01-01T00:00:00Z
-```
-
-### Text Search
-
-A global text search is available on all endpoints using the `search` parameter:
-
-```
-/api/products/?search=vodka
-/api/suppliers/?search=acme
-```
-
-This performs a case-insensitive search across multiple relevant fields.
-
-### Relationship Filters
-
-You can filter by related object fields:
-
-```
-/api/products/?category_name=spirits
-/api/inventory-items/?product_name=vodka
-```
-
-### Boolean Filters
-
-Some endpoints support boolean filters for special conditions:
-
-```
-/api/categories/?has_products=true
-/api/suppliers/?has_orders=false
-```
-
-## Operators
-
-The following operators are supported for field lookups:
-
-- Exact match: `field=value`
-- Contains (case-insensitive): `field__icontains=value`
-- Greater than or equal: `field__gte=value`
-- Less than or equal: `field__lte=value`
-- In list: `field__in=value1,value2,value3`
-- Is null: `field__isnull=true`
-
-Example:
-
-```
-/api/products/?name__icontains=vodka&unit_price__gte=20
-```
-"""
+@cache
+def get_filtering_docs():
+    """
+    Get the filtering documentation.
+    """
+    return read_documentation('filtering')
 
 # Sorting Documentation
 
-SORTING_DOCS = """
-# Sorting
-
-All list endpoints support sorting through the `ordering` parameter.
-
-## Basic Sorting
-
-To sort by a field in ascending order:
-
-```
-/api/products/?ordering=name
-```
-
-## Reverse Sorting
-
-To sort in descending order, prefix the field with a dash (`-`):
-
-```
-/api/products/?ordering=-created_at
-```
-
-## Multiple Sort Fields
-
-You can sort by multiple fields by separating them with commas:
-
-```
-/api/products/?ordering=category__name,-unit_price
-```
-
-This sorts by category name (ascending), then by unit price (descending).
-
-## Available Sort Fields
-
-Each endpoint defines which fields can be used for sorting via the `ordering_fields` parameter.
-Common sortable fields include:
-
-- `name`: Sort by name
-- `created_at`: Sort by creation date
-- `updated_at`: Sort by last update date
-- `price`/`unit_price`: Sort by price (where applicable)
-- `quantity`: Sort by quantity (where applicable)
-
-Additional fields may be available for specific endpoints.
-"""
+@cache
+def get_sorting_docs():
+    """
+    Get the sorting documentation.
+    """
+    return read_documentation('sorting')
 
 # Pagination Documentation
 
-PAGINATION_DOCS = """
-# Pagination
-
-All list endpoints in the CocktailAI API are paginated by default.
-
-## Default Pagination
-
-By default, endpoints return 20 items per page.
-
-## Page-Based Pagination
-
-The API uses page-based pagination with the following query parameters:
-
-- `page`: The page number (1-based indexing)
-- `page_size`: Number of items per page (max 100)
-
-Example:
-
-```
-/api/products/?page=2&page_size=50
-```
-
-## Pagination Response Format
-
-Paginated responses include the following metadata:
-
-```json
-{
-  "count": 100,           // Total number of items
-  "next": "http://...",   // URL to the next page (null if none)
-  "previous": "http://...", // URL to the previous page (null if none)
-  "results": [...]        // Array of items for the current page
-}
-```
-
-## Nested Endpoints
-
-Nested resource endpoints (accessed via detail actions) use a smaller pagination
-size of 10 items per page by default.
-
-Examples of nested endpoints:
-
-```
-/api/products/{id}/inventory/
-/api/categories/{id}/products/
-/api/locations/{id}/inventory/
-```
-"""
+@cache
+def get_pagination_docs():
+    """
+    Get the pagination documentation.
+    """
+    return read_documentation('pagination')
 
 # Combined API Features Documentation
 
-API_FEATURES_DOCS = f"""
-# API Features
-
-The CocktailAI API provides a rich set of features for interacting with the data.
-
-{FILTERING_DOCS}
-
-{SORTING_DOCS}
-
-{PAGINATION_DOCS}
-
-{VALIDATION_DOCS}
-"""
+@cache
+def get_api_features_docs():
+    """
+    Get the combined documentation for all API features.
+    """
+    return "\n".join((
+        read_documentation('api_features'),
+        get_filtering_docs(),
+        get_sorting_docs(),
+        get_pagination_docs(),
+        get_validation_docs(),
+    ))
 
 # Schema extensions for documentation
+# Each example is built once, the first time the schema asks for it.
+
+# Shared placeholder value for the examples; the documentation is in their descriptions.
+# A plain dict, as the YAML schema renderer cannot represent read-only mapping proxies.
+SEE_DESCRIPTION_VALUE = {"message": "See description for full documentation"}
 
+@cache
 def get_api_features_example():
     """
     Get an example of API features for the OpenAPI schema.
@@ -339,10 +90,11 @@ def get_api_features_example():
     return OpenApiExample(
         name="api-features",
         summary="API Features Documentation",
-        description=API_FEATURES_DOCS,
-        value={"message": "See description for full API features documentation"}
+        description=get_api_features_docs(),
+        value=SEE_DESCRIPTION_VALUE
     )
 
+@cache
 def get_filtering_example():
     """
     Get an example of filtering capabilities for the OpenAPI schema.
@@ -350,10 +102,11 @@ def get_filtering_example():
     return OpenApiExample(
         name="filtering",
         summary="Filtering Documentation",
-        description=FILTERING_DOCS,
-        value={"message": "See description for full filtering documentation"}
+        description=get_filtering_docs(),
+        value=SEE_DESCRIPTION_VALUE
     )
 
+@cache
 def get_sorting_example():
     """
     Get an example of sorting capabilities for the OpenAPI schema.
@@ -361,10 +114,11 @@ def get_sorting_example():
     return OpenApiExample(
         name="sorting",
         summary="Sorting Documentation",
-        description=SORTING_DOCS,
-        value={"message": "See description for full sorting documentation"}
+        description=get_sorting_docs(),
+        value=SEE_DESCRIPTION_VALUE
     )
 
+@cache
 def get_pagination_example():
     """
     Get an example of pagination capabilities for the OpenAPI schema.
@@ -372,10 +126,11 @@ def get_pagination_example():
     return OpenApiExample(
         name="pagination",
         summary="Pagination Documentation",
-        description=PAGINATION_DOCS,
-        value={"message": "See description for full pagination documentation"}
+        description=get_pagination_docs(),
+        value=SEE_DESCRIPTION_VALUE
     )
 
+@cache
 def get_validation_example():
     """
     Get an example of field validation rules for the OpenAPI schema.
@@ -383,6 +138,32 @@ def get_validation_example():
     return OpenApiExample(
         name="validation",
         summary="Field Validation Documentation",
-        description=VALIDATION_DOCS,
-        value={"message": "See description for full validation documentation"}
-    ) 
\ No newline at end of file
+        description=get_validation_docs(),
+        value=SEE_DESCRIPTION_VALUE
+    ) 
+
+# Module-level names for the examples, e.g. docs.FILTERING_EXAMPLE.
+# They are resolved on first access rather than at import, so importing this
+# module still doesn't read the documentation files.
+
+EXAMPLE_GETTERS = {
+    "API_FEATURES_EXAMPLE": get_api_features_example,
+    "FILTERING_EXAMPLE": get_filtering_example,
+    "SORTING_EXAMPLE": get_sorting_example,
+    "PAGINATION_EXAMPLE": get_pagination_example,
+    "VALIDATION_EXAMPLE": get_validation_example,
+}
+
+
+def __getattr__(name):
+    """
+    Build a module-level example on first access and keep it as a global.
+    
+    Later lookups find the global directly and no longer come through here.
+    """
+    try:
+        getter = EXAMPLE_GETTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    example = globals()[name] = getter()
+    return example
@@ -0,0 +1,45 @@
+"""
+Streaming exports for the API's list endpoints.
+"""
+
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from .schema import extend_schema_with_auth
+
+
+class ExportMixin:
+    """
+    ViewSet mixin adding an `export` action that streams the filtered list.
+    
+    The rows are written as JSON lines, in the list representation. They are
+    read with QuerySet.iterator() in chunks of export_chunk_size and rendered
+    one at a time by a single serializer, so memory use stays flat however
+    many rows there are. A paginated list instead holds its whole page in a
+    ReturnList before rendering it.
+    """
+    export_chunk_size = 2000
+    
+    @extend_schema_with_auth(
+        summary="Export the list as JSON lines",
+        description="Streams every row matching the list filters, one JSON object per line, without pagination."
+    )
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream the filtered list, one JSON object per line.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        encoder = JSONEncoder(
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            allow_nan=not api_settings.STRICT_JSON,
+            separators=(',', ':') if api_settings.COMPACT_JSON else (', ', ': '),
+        )
+        rows = (
+            encoder.encode(serializer.to_representation(row)) + '\n'
+            for row in queryset.iterator(chunk_size=self.export_chunk_size)
+        )
+        return StreamingHttpResponse(rows, content_type='application/x-ndjson')
@@ -2,25 +2,115 @@
 Filter classes for the CocktailAI API.
 """
 
+from functools import reduce, wraps
+from operator import or_
+
 import django_filters
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Exists, OuterRef, Q
 from inventory.models import (
     Product, InventoryItem, InventoryTransaction, InventoryCount, Order,
     Category, Supplier, Location
 )
 
 
-class CategoryFilter(django_filters.FilterSet):
+def skip_if_blank(method):
     """
-    Filter for categories with advanced filtering options.
+    Decorate a filter method to return the queryset untouched for blank values.
+    
+    django-filter already skips empty strings, but whitespace-only input still
+    reaches the method.
+    """
+    @wraps(method)
+    def wrapper(self, queryset, name, value):
+        if not value or not str(value).strip():
+            return queryset
+        return method(self, queryset, name, value)
+    return wrapper
+
+
+class ChoiceInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """
+    Comma-separated `__in` filter restricted to a field's choices.
+    
+    Unknown values are dropped; if none of the requested values is valid the
+    queryset is emptied without querying the database.
+    """
+    def __init__(self, *args, choices=(), **kwargs):
+        kwargs.setdefault('lookup_expr', 'in')
+        super().__init__(*args, **kwargs)
+        self.valid_values = frozenset(choice for choice, _ in choices)
+    
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        values = self.valid_values.intersection(value)
+        if not values:
+            return qs.none()
+        return super().filter(qs, sorted(values))
+
+
+class CreatedFilterSet(django_filters.FilterSet):
+    """
+    Base filter set adding date range filters on `created_at`.
     """
-    search = django_filters.CharFilter(method='search_filter')
     created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
     created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
+
+
+class TimestampFilterSet(CreatedFilterSet):
+    """
+    Base filter set adding date range filters on `created_at` and `updated_at`.
+    """
     updated_after = django_filters.DateFilter(field_name='updated_at', lookup_expr='gte')
     updated_before = django_filters.DateFilter(field_name='updated_at', lookup_expr='lte')
+
+
+class SearchFilterSet(django_filters.FilterSet):
+    """
+    Base filter set adding a free-text `search` filter.
+    
+    Subclasses list the lookups to match in `search_fields`; a row matches
+    if any of them does.
+    """
+    search = django_filters.CharFilter(method='search_filter')
+    
+    search_fields = ()
+    
+    @skip_if_blank
+    def search_filter(self, queryset, name, value):
+        """
+        Search across multiple fields.
+        """
+        return queryset.filter(
+            reduce(or_, (Q(**{field: value}) for field in self.search_fields))
+        )
+    
+    def get_form_class(self):
+        """
+        Build the form class once per filter set class and reuse it.
+        
+        The declared filters never change per request, and Django forms copy
+        their base fields for each instance, so the class can be shared.
+        """
+        cls = type(self)
+        form_class = cls.__dict__.get('_form_class')
+        if form_class is None:
+            form_class = cls._form_class = super().get_form_class()
+        return form_class
+
+
+class CategoryFilter(TimestampFilterSet, SearchFilterSet):
+    """
+    Filter for categories with advanced filtering options.
+    """
     has_products = django_filters.BooleanFilter(method='filter_has_products')
     
+    search_fields = (
+        'name__icontains',
+        'description__icontains',
+    )
+    
     class Meta:
         model = Category
         fields = {
@@ -29,37 +119,31 @@ class CategoryFilter(django_filters.FilterSet):
             'is_active': ['exact'],
         }
     
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value)
-        )
-    
     def filter_has_products(self, queryset, name, value):
         """
         Filter categories that have products.
         """
         if value:
-            return queryset.filter(products__isnull=False).distinct()
-        else:
-            return queryset.filter(products__isnull=True).distinct()
+            return queryset.filter(product_count__gt=0)
+        return queryset.filter(product_count=0)
 
 
-class SupplierFilter(django_filters.FilterSet):
+class SupplierFilter(TimestampFilterSet, SearchFilterSet):
     """
     Filter for suppliers with advanced filtering options.
     """
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
-    updated_after = django_filters.DateFilter(field_name='updated_at', lookup_expr='gte')
-    updated_before = django_filters.DateFilter(field_name='updated_at', lookup_expr='lte')
     has_products = django_filters.BooleanFilter(method='filter_has_products')
     has_orders = django_filters.BooleanFilter(method='filter_has_orders')
     
+    search_fields = (
+        'name__icontains',
+        'contact_name__icontains',
+        'email__icontains',
+        'phone__icontains',
+        'address__icontains',
+        'notes__icontains',
+    )
+    
     class Meta:
         model = Supplier
         fields = {
@@ -70,49 +154,34 @@ class SupplierFilter(django_filters.FilterSet):
             'is_active': ['exact'],
         }
     
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(contact_name__icontains=value) |
-            Q(email__icontains=value) |
-            Q(phone__icontains=value) |
-            Q(address__icontains=value) |
-            Q(notes__icontains=value)
-        )
-    
     def filter_has_products(self, queryset, name, value):
         """
         Filter suppliers that have products.
         """
         if value:
-            return queryset.filter(products__isnull=False).distinct()
-        else:
-            return queryset.filter(products__isnull=True).distinct()
+            return queryset.filter(product_count__gt=0)
+        return queryset.filter(product_count=0)
     
     def filter_has_orders(self, queryset, name, value):
         """
         Filter suppliers that have orders.
         """
-        if value:
-            return queryset.filter(orders__isnull=False).distinct()
-        else:
-            return queryset.filter(orders__isnull=True).distinct()
+        has_orders = Exists(Order.objects.filter(supplier=OuterRef('pk')))
+        return queryset.filter(has_orders if value else ~has_orders)
 
 
-class LocationFilter(django_filters.FilterSet):
+class LocationFilter(TimestampFilterSet, SearchFilterSet):
     """
     Filter for locations with advanced filtering options.
     """
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
-    updated_after = django_filters.DateFilter(field_name='updated_at', lookup_expr='gte')
-    updated_before = django_filters.DateFilter(field_name='updated_at', lookup_expr='lte')
     has_inventory = django_filters.BooleanFilter(method='filter_has_inventory')
     
+    search_fields = (
+        'name__icontains',
+        'description__icontains',
+        'address__icontains',
+    )
+    
     class Meta:
         model = Location
         fields = {
@@ -121,27 +190,16 @@ class LocationFilter(django_filters.FilterSet):
             'is_active': ['exact'],
         }
     
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value) |
-            Q(address__icontains=value)
-        )
-    
     def filter_has_inventory(self, queryset, name, value):
         """
         Filter locations that have inventory.
         """
         if value:
-            return queryset.filter(inventory_items__isnull=False).distinct()
-        else:
-            return queryset.filter(inventory_items__isnull=True).distinct()
+            return queryset.filter(inventory_item_count__gt=0)
+        return queryset.filter(inventory_item_count=0)
 
 
-class ProductFilter(django_filters.FilterSet):
+class ProductFilter(CreatedFilterSet, SearchFilterSet):
     """
     Filter for products with advanced filtering options.
     """
@@ -149,9 +207,6 @@ class ProductFilter(django_filters.FilterSet):
     max_price = django_filters.NumberFilter(field_name='unit_price', lookup_expr='lte')
     min_quantity = django_filters.NumberFilter(field_name='total_quantity', lookup_expr='gte')
     max_quantity = django_filters.NumberFilter(field_name='total_quantity', lookup_expr='lte')
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
     category_name = django_filters.CharFilter(field_name='category__name', lookup_expr='icontains')
     supplier_name = django_filters.CharFilter(field_name='supplier__name', lookup_expr='icontains')
     
@@ -167,32 +222,51 @@ class ProductFilter(django_filters.FilterSet):
             'is_active': ['exact'],
         }
     
+    # Partial matches, which full-text search only finds as whole words; the
+    # product columns are backed by the products' trigram index
+    search_fields = (
+        'name__icontains',
+        'sku__icontains',
+        'barcode__icontains',
+        'description__icontains',
+        'category__name__icontains',
+        'supplier__name__icontains',
+    )
+    
+    @skip_if_blank
     def search_filter(self, queryset, name, value):
         """
-        Search across multiple fields.
+        Full-text search over the products' search documents, or partial
+        matches on the searched columns.
+        
+        The documents cover the same columns, so full-text search adds
+        stemmed whole-word matches to the partial ones.
         """
         return queryset.filter(
-            Q(name__icontains=value) |
-            Q(sku__icontains=value) |
-            Q(barcode__icontains=value) |
-            Q(description__icontains=value) |
-            Q(category__name__icontains=value) |
-            Q(supplier__name__icontains=value)
+            reduce(
+                or_,
+                (Q(**{field: value}) for field in self.search_fields),
+                Q(search_document=SearchQuery(value, config=Product.SEARCH_CONFIG, search_type='websearch'))
+            )
         )
 
 
-class InventoryItemFilter(django_filters.FilterSet):
+class InventoryItemFilter(CreatedFilterSet, SearchFilterSet):
     """
     Filter for inventory items with advanced filtering options.
     """
     min_quantity = django_filters.NumberFilter(field_name='quantity', lookup_expr='gte')
     max_quantity = django_filters.NumberFilter(field_name='quantity', lookup_expr='lte')
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
     product_name = django_filters.CharFilter(field_name='product__name', lookup_expr='icontains')
     location_name = django_filters.CharFilter(field_name='location__name', lookup_expr='icontains')
     
+    search_fields = (
+        'product__name__icontains',
+        'product__sku__icontains',
+        'product__barcode__icontains',
+        'location__name__icontains',
+    )
+    
     class Meta:
         model = InventoryItem
         fields = {
@@ -200,20 +274,9 @@ class InventoryItemFilter(django_filters.FilterSet):
             'location': ['exact'],
             'is_active': ['exact'],
         }
-    
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(product__name__icontains=value) |
-            Q(product__sku__icontains=value) |
-            Q(product__barcode__icontains=value) |
-            Q(location__name__icontains=value)
-        )
 
 
-class InventoryTransactionFilter(django_filters.FilterSet):
+class InventoryTransactionFilter(CreatedFilterSet, SearchFilterSet):
     """
     Filter for inventory transactions with advanced filtering options.
     """
@@ -223,103 +286,88 @@ class InventoryTransactionFilter(django_filters.FilterSet):
     max_unit_price = django_filters.NumberFilter(field_name='unit_price', lookup_expr='lte')
     min_total_value = django_filters.NumberFilter(field_name='total_value', lookup_expr='gte')
     max_total_value = django_filters.NumberFilter(field_name='total_value', lookup_expr='lte')
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
-    product_name = django_filters.CharFilter(field_name='inventory_item__product__name', lookup_expr='icontains')
-    location_name = django_filters.CharFilter(field_name='inventory_item__location__name', lookup_expr='icontains')
+    product_name = django_filters.CharFilter(field_name='product__name', lookup_expr='icontains')
+    location_name = django_filters.CharFilter(field_name='location__name', lookup_expr='icontains')
+    transaction_type__in = ChoiceInFilter(
+        field_name='transaction_type',
+        choices=InventoryTransaction.TRANSACTION_TYPE_CHOICES,
+    )
+    
+    search_fields = (
+        'product__name__icontains',
+        'location__name__icontains',
+        'reference__icontains',
+        'notes__icontains',
+    )
     
     class Meta:
         model = InventoryTransaction
         fields = {
-            'inventory_item': ['exact'],
-            'inventory_item__product': ['exact'],
-            'inventory_item__location': ['exact'],
-            'transaction_type': ['exact', 'in'],
+            'product': ['exact'],
+            'location': ['exact'],
+            'destination_location': ['exact'],
+            'transaction_type': ['exact'],
             'performed_by': ['exact'],
             'is_active': ['exact'],
         }
-    
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(inventory_item__product__name__icontains=value) |
-            Q(inventory_item__location__name__icontains=value) |
-            Q(reference__icontains=value) |
-            Q(notes__icontains=value)
-        )
 
 
-class OrderFilter(django_filters.FilterSet):
+class OrderFilter(CreatedFilterSet, SearchFilterSet):
     """
     Filter for orders with advanced filtering options.
     """
     min_total_cost = django_filters.NumberFilter(field_name='total_cost', lookup_expr='gte')
     max_total_cost = django_filters.NumberFilter(field_name='total_cost', lookup_expr='lte')
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
     order_date_after = django_filters.DateFilter(field_name='order_date', lookup_expr='gte')
     order_date_before = django_filters.DateFilter(field_name='order_date', lookup_expr='lte')
     received_date_after = django_filters.DateFilter(field_name='received_date', lookup_expr='gte')
     received_date_before = django_filters.DateFilter(field_name='received_date', lookup_expr='lte')
     supplier_name = django_filters.CharFilter(field_name='supplier__name', lookup_expr='icontains')
+    status__in = ChoiceInFilter(field_name='status', choices=Order.STATUS_CHOICES)
+    
+    search_fields = (
+        'reference_number__icontains',
+        'supplier__name__icontains',
+        'notes__icontains',
+    )
     
     class Meta:
         model = Order
         fields = {
             'supplier': ['exact'],
-            'status': ['exact', 'in'],
+            'status': ['exact'],
             'created_by': ['exact'],
             'is_active': ['exact'],
             'reference_number': ['exact', 'icontains'],
         }
-    
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(reference_number__icontains=value) |
-            Q(supplier__name__icontains=value) |
-            Q(notes__icontains=value)
-        )
 
 
-class InventoryCountFilter(django_filters.FilterSet):
+class InventoryCountFilter(CreatedFilterSet, SearchFilterSet):
     """
     Filter for inventory counts with advanced filtering options.
     """
-    search = django_filters.CharFilter(method='search_filter')
-    created_after = django_filters.DateFilter(field_name='created_at', lookup_expr='gte')
-    created_before = django_filters.DateFilter(field_name='created_at', lookup_expr='lte')
     scheduled_after = django_filters.DateFilter(field_name='scheduled_date', lookup_expr='gte')
     scheduled_before = django_filters.DateFilter(field_name='scheduled_date', lookup_expr='lte')
     completed_after = django_filters.DateFilter(field_name='completed_date', lookup_expr='gte')
     completed_before = django_filters.DateFilter(field_name='completed_date', lookup_expr='lte')
     location_name = django_filters.CharFilter(field_name='location__name', lookup_expr='icontains')
+    status__in = ChoiceInFilter(field_name='status', choices=InventoryCount.STATUS_CHOICES)
+    
+    search_fields = (
+        'name__icontains',
+        'description__icontains',
+        'notes__icontains',
+        'count_id__icontains',
+        'location__name__icontains',
+    )
     
     class Meta:
         model = InventoryCount
         fields = {
             'location': ['exact'],
-            'status': ['exact', 'in'],
+            'status': ['exact'],
             'created_by': ['exact'],
             'completed_by': ['exact'],
             'is_active': ['exact'],
             'count_id': ['exact', 'icontains'],
         }
-    
-    def search_filter(self, queryset, name, value):
-        """
-        Search across multiple fields.
-        """
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value) |
-            Q(notes__icontains=value) |
-            Q(count_id__icontains=value) |
-            Q(location__name__icontains=value)
-        ) 
\ No newline at end of file
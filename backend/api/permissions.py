@@ -2,99 +2,168 @@
 Custom permission classes for the CocktailAI API.
 """
 
+from collections import namedtuple
+from functools import cache
+
 from rest_framework import permissions
 
 
-class IsStaffOrReadOnly(permissions.BasePermission):
+_SAFE_METHODS = frozenset(permissions.SAFE_METHODS)
+_UPDATE_METHODS = frozenset(('PUT', 'PATCH'))
+
+# Fields that identify an object's owner, in order of precedence
+OWNERSHIP_FIELDS = ('created_by', 'performed_by', 'user', 'owner')
+
+UserFlags = namedtuple('UserFlags', ('is_authenticated', 'is_staff', 'is_superuser'))
+
+
+def get_user_flags(request):
     """
-    Permission to allow only staff members to modify objects.
-    Non-authenticated users have no access.
-    Authenticated non-staff users have read-only access.
+    Return the requesting user's UserFlags.
+    
+    Read from request.user once per request and kept on the request, since
+    every permission class and every object check consults them.
+    """
+    flags = getattr(request, '_user_flags', None)
+    if flags is None:
+        user = request.user
+        flags = request._user_flags = UserFlags._make(
+            bool(user and getattr(user, flag)) for flag in UserFlags._fields
+        )
+    return flags
+
+
+@cache
+def get_owner_attname(model, owner_fields=OWNERSHIP_FIELDS):
     """
+    Return the column attribute (e.g. 'created_by_id') holding the owner's key.
     
-    def has_permission(self, request, view):
-        # Authenticate the user
-        if not request.user or not request.user.is_authenticated:
-            return False
-            
-        # Allow GET, HEAD, OPTIONS requests for authenticated users
-        if request.method in permissions.SAFE_METHODS:
-            return True
-            
-        # Allow write operations only for staff
-        return request.user.is_staff
+    Resolved once per model and candidate tuple from the model's declared
+    foreign keys; None if it has none of owner_fields.
+    """
+    fields = {
+        field.name: field for field in model._meta.get_fields()
+        if not field.auto_created and (field.many_to_one or field.one_to_one)
+    }
+    for name in owner_fields:
+        if name in fields:
+            return fields[name].attname
+    return None
 
 
-class IsOwnerOrStaffOrReadOnly(permissions.BasePermission):
+def is_owner(user, obj, owner_fields=OWNERSHIP_FIELDS):
     """
-    Permission to allow owners or staff to modify objects.
-    Non-authenticated users have no access.
-    Authenticated non-owner, non-staff users have read-only access.
+    Return whether user owns obj according to its owner field.
     
-    Standardized to check created_by field for ownership.
+    Compares the foreign key column, so the related user is never fetched.
+    """
+    owner_attname = get_owner_attname(type(obj), owner_fields)
+    return owner_attname is not None and getattr(obj, owner_attname) == user.id
+
+
+class AccessPermission(permissions.BasePermission):
     """
+    Configurable base for the authenticated-only permissions below.
     
-    def has_permission(self, request, view):
+    Non-authenticated users never have access. Subclasses configure the rest:
+    
+    - read_for_all: safe methods are allowed for any authenticated user.
+    - write_flag: UserFlags field (e.g. 'is_staff') required for unsafe
+      methods at the view level; None defers to the object check.
+    - check_objects: restrict object access to staff and owners
+      (see is_object_owner).
+    - owner_fields: candidate owner fields, in order of precedence.
+    """
+    
+    read_for_all = True
+    write_flag = None
+    check_objects = False
+    owner_fields = OWNERSHIP_FIELDS
+    
+    def __new__(cls):
+        """
+        Return the one shared instance of this permission class.
+        
+        The configuration lives on the class and per-request state on the
+        request, so the instance DRF creates for every request can be reused.
+        """
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
+    
+    # The safe method set is bound as a default argument so the checks read
+    # it as a local rather than a global
+    def has_permission(self, request, view, _safe_methods=_SAFE_METHODS):
+        flags = get_user_flags(request)
+        
         # Authenticate the user
-        if not request.user or not request.user.is_authenticated:
+        if not flags.is_authenticated:
             return False
-            
-        # Allow GET, HEAD, OPTIONS requests for authenticated users
-        if request.method in permissions.SAFE_METHODS:
+        
+        if self.write_flag is None:
             return True
-            
-        # Create operations pass to has_object_permission
-        if view.action == 'create':
+        
+        # Allow GET, HEAD, OPTIONS requests for authenticated users
+        if self.read_for_all and request.method in _safe_methods:
             return True
-            
-        # Update/Delete pass to has_object_permission
-        return True
+        
+        return getattr(flags, self.write_flag)
     
-    def has_object_permission(self, request, view, obj):
+    def has_object_permission(self, request, view, obj, _safe_methods=_SAFE_METHODS):
+        if not self.check_objects:
+            return True
+        
         # Allow GET, HEAD, OPTIONS requests for authenticated users
-        if request.method in permissions.SAFE_METHODS:
+        if self.read_for_all and request.method in _safe_methods:
             return True
-            
+        
         # Staff can do anything
-        if request.user.is_staff:
+        if get_user_flags(request).is_staff:
             return True
-            
-        # Standardized ownership check - prioritize created_by
-        if hasattr(obj, 'created_by'):
-            return obj.created_by == request.user
-        # Fallback to other ownership fields if created_by doesn't exist
-        elif hasattr(obj, 'performed_by'):
-            return obj.performed_by == request.user
-        elif hasattr(obj, 'user'):
-            return obj.user == request.user
-        elif hasattr(obj, 'owner'):
-            return obj.owner == request.user
-            
-        # If no ownership field found, deny permission
-        return False
+        
+        return self.is_object_owner(request, obj)
+    
+    def is_object_owner(self, request, obj):
+        """Return whether the requesting user may modify obj as its owner."""
+        # Standardized ownership check - prioritize created_by; objects
+        # without an ownership field are denied
+        return is_owner(request.user, obj, self.owner_fields)
 
 
-class IsAdminOrReadOnly(permissions.BasePermission):
+class IsStaffOrReadOnly(AccessPermission):
+    """
+    Permission to allow only staff members to modify objects.
+    Non-authenticated users have no access.
+    Authenticated non-staff users have read-only access.
+    """
+    
+    write_flag = 'is_staff'
+
+
+class IsOwnerOrStaffOrReadOnly(AccessPermission):
+    """
+    Permission to allow owners or staff to modify objects.
+    Non-authenticated users have no access.
+    Authenticated non-owner, non-staff users have read-only access.
+    
+    Standardized to check created_by field for ownership.
+    """
+    
+    check_objects = True
+
+
+class IsAdminOrReadOnly(AccessPermission):
     """
     Permission to allow only admin users to modify sensitive objects.
     Non-authenticated users have no access.
     Non-admin authenticated users have read-only access.
     """
     
-    def has_permission(self, request, view):
-        # Authenticate the user
-        if not request.user or not request.user.is_authenticated:
-            return False
-            
-        # Allow GET, HEAD, OPTIONS requests for authenticated users
-        if request.method in permissions.SAFE_METHODS:
-            return True
-            
-        # Allow write operations only for admin
-        return request.user.is_superuser
+    write_flag = 'is_superuser'
 
 
-class IsOwnerOrStaff(permissions.BasePermission):
+class IsOwnerOrStaff(AccessPermission):
     """
     Permission to allow only owners or staff access.
     Objects are completely restricted from non-owners or non-staff.
@@ -102,31 +171,11 @@ class IsOwnerOrStaff(permissions.BasePermission):
     Standardized to check created_by field for ownership.
     """
     
-    def has_permission(self, request, view):
-        # Authenticate the user
-        return request.user and request.user.is_authenticated
-    
-    def has_object_permission(self, request, view, obj):
-        # Staff can do anything
-        if request.user.is_staff:
-            return True
-            
-        # Standardized ownership check - prioritize created_by
-        if hasattr(obj, 'created_by'):
-            return obj.created_by == request.user
-        # Fallback to other ownership fields if created_by doesn't exist
-        elif hasattr(obj, 'performed_by'):
-            return obj.performed_by == request.user
-        elif hasattr(obj, 'user'):
-            return obj.user == request.user
-        elif hasattr(obj, 'owner'):
-            return obj.owner == request.user
-            
-        # If no ownership field found, deny permission
-        return False
+    read_for_all = False
+    check_objects = True
 
 
-class IsInventoryCountParticipant(permissions.BasePermission):
+class IsInventoryCountParticipant(AccessPermission):
     """
     Permission for inventory count participants.
     
@@ -137,32 +186,22 @@ class IsInventoryCountParticipant(permissions.BasePermission):
     - Others with read-only access if authenticated
     """
     
-    def has_permission(self, request, view):
-        # Authenticate the user
-        return request.user and request.user.is_authenticated
+    check_objects = True
     
-    def has_object_permission(self, request, view, obj):
-        # Allow GET, HEAD, OPTIONS requests for authenticated users
-        if request.method in permissions.SAFE_METHODS:
-            return True
-            
-        # Staff can do anything
-        if request.user.is_staff:
-            return True
-            
+    def is_object_owner(self, request, obj):
         # Creator can do anything
-        if obj.created_by == request.user:
+        if obj.created_by_id == request.user.id:
             return True
-            
+        
         # Assigned counter can only update when in progress
-        if obj.completed_by == request.user and obj.status == 'in_progress':
-            if request.method in ['PUT', 'PATCH']:
-                return True
-                
-        return False
+        return (
+            obj.completed_by_id == request.user.id
+            and obj.status == 'in_progress'
+            and request.method in _UPDATE_METHODS
+        )
 
 
-class IsOrderParticipant(permissions.BasePermission):
+class IsOrderParticipant(AccessPermission):
     """
     Permission for order participants.
     
@@ -173,39 +212,30 @@ class IsOrderParticipant(permissions.BasePermission):
     - Others with read-only access if authenticated
     """
     
-    def has_permission(self, request, view):
-        # Authenticate the user
-        return request.user and request.user.is_authenticated
+    check_objects = True
     
-    def has_object_permission(self, request, view, obj):
-        # Allow GET, HEAD, OPTIONS requests for authenticated users
-        if request.method in permissions.SAFE_METHODS:
-            return True
-            
-        # Staff can do anything
-        if request.user.is_staff:
-            return True
-            
+    def is_object_owner(self, request, obj):
         # Creator can do anything
-        if obj.created_by == request.user:
+        if obj.created_by_id == request.user.id:
             return True
-            
+        
         # Assigned updater can only modify when not cancelled
-        if obj.updated_by == request.user and obj.status != 'cancelled':
-            if request.method in ['PUT', 'PATCH']:
-                return True
-                
-        return False
+        return (
+            obj.updated_by_id == request.user.id
+            and obj.status != 'cancelled'
+            and request.method in _UPDATE_METHODS
+        )
 
 
 class IsAuthenticatedForMethods(permissions.BasePermission):
     """
     Permission to allow only authenticated users for specific HTTP methods,
     and public access for others.
+    
+    Subclasses choose other methods by overriding authenticated_methods.
     """
     
-    def __init__(self, authenticated_methods=None):
-        self.authenticated_methods = authenticated_methods or ['POST', 'PUT', 'PATCH', 'DELETE']
+    authenticated_methods = frozenset(('POST', 'PUT', 'PATCH', 'DELETE'))
     
     def has_permission(self, request, view):
         # Allow any access for non-authenticated methods
@@ -213,4 +243,4 @@ class IsAuthenticatedForMethods(permissions.BasePermission):
             return True
             
         # Require authentication for authenticated methods
-        return request.user and request.user.is_authenticated 
\ No newline at end of file
+        return get_user_flags(request).is_authenticated 
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Renderers for the CocktailAI API.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson.
+    
+    Types orjson leaves to its default hook (Decimal, lazy translation
+    strings) and datetimes go through DRF's JSONEncoder.default, so the
+    output matches JSONRenderer's. Indented or ASCII-only output, as the
+    settings or the Accept header may ask for, is left to JSONRenderer.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def __init__(self):
+        self._default = JSONEncoder().default
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        ret = orjson.dumps(data, default=self._default, option=self.options)
+        # Escaped like JSONRenderer does, for JSON embedded in JavaScript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
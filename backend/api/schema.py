@@ -7,15 +7,20 @@ from drf_spectacular.utils import (
     OpenApiParameter, OpenApiExample, 
     OpenApiResponse, inline_serializer,
     extend_schema_field, extend_schema_serializer,
-    OpenApiTypes
 )
 from drf_spectacular.types import OpenApiTypes
+from functools import cache
 from rest_framework import serializers
 from typing import Dict, List, Any, Optional, Union
 
+# The builders below return static schema fragments, so each is cached and the
+# same objects are shared by every decorator using them. Callers must not
+# mutate the returned lists and dicts.
+
 
 # Examples for validator-related responses
 
+@cache
 def validator_examples() -> Dict[str, OpenApiExample]:
     """
     Examples of validation errors for the API documentation.
@@ -96,42 +101,33 @@ def validator_examples() -> Dict[str, OpenApiExample]:
     }
 
 
+def query_parameter(name: str, type: Any, description: str) -> OpenApiParameter:
+    """
+    Build an optional query parameter, the only kind documented below.
+    """
+    return OpenApiParameter(
+        name=name,
+        type=type,
+        location=OpenApiParameter.QUERY,
+        description=description,
+        required=False,
+    )
+
+
+@cache
 def common_schema_parameters() -> List[OpenApiParameter]:
     """
     Common query parameters used across multiple endpoints.
     """
     return [
-        OpenApiParameter(
-            name="page",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Page number for pagination",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="page_size",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Number of results per page",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="ordering",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Order by field (prefix with '-' for descending order)",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="search",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Search term for text-based search",
-            required=False,
-        ),
+        query_parameter("page", OpenApiTypes.INT, "Page number for pagination"),
+        query_parameter("page_size", OpenApiTypes.INT, "Number of results per page"),
+        query_parameter("ordering", OpenApiTypes.STR, "Order by field (prefix with '-' for descending order)"),
+        query_parameter("search", OpenApiTypes.STR, "Search term for text-based search"),
     ]
 
 
+@cache
 def error_responses() -> Dict[str, OpenApiResponse]:
     """
     Common error responses used across multiple endpoints.
@@ -205,14 +201,11 @@ def extend_schema_with_auth(
         operation_id: A unique identifier for the operation
         **kwargs: Additional keyword arguments passed to extend_schema
     """
-    # Ensure we have responses dict
-    if responses is None:
-        responses = {}
-    
-    # Add common error responses
+    # Add the common error responses the operation doesn't document itself,
+    # on a copy so the caller's dict is left untouched
+    responses = dict(responses or ())
     for status_code, response in error_responses().items():
-        if status_code not in responses:
-            responses[status_code] = response
+        responses.setdefault(status_code, response)
     
     # Return decorated function
     return extend_schema(
@@ -225,198 +218,77 @@ def extend_schema_with_auth(
     )
 
 
+@cache
 def inventory_parameters() -> List[OpenApiParameter]:
     """
     Common query parameters for inventory-related endpoints.
     """
     common_params = common_schema_parameters()
     inventory_params = [
-        OpenApiParameter(
-            name="is_active",
-            type=OpenApiTypes.BOOL,
-            location=OpenApiParameter.QUERY,
-            description="Filter by active status",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="created_after",
-            type=OpenApiTypes.DATE,
-            location=OpenApiParameter.QUERY,
-            description="Filter by creation date (after specified date)",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="created_before",
-            type=OpenApiTypes.DATE,
-            location=OpenApiParameter.QUERY,
-            description="Filter by creation date (before specified date)",
-            required=False,
-        ),
+        query_parameter("is_active", OpenApiTypes.BOOL, "Filter by active status"),
+        query_parameter("created_after", OpenApiTypes.DATE, "Filter by creation date (after specified date)"),
+        query_parameter("created_before", OpenApiTypes.DATE, "Filter by creation date (before specified date)"),
     ]
     return common_params + inventory_params
 
 
+@cache
 def product_parameters() -> List[OpenApiParameter]:
     """
     Query parameters for product-related endpoints.
     """
     inventory_params = inventory_parameters()
     product_params = [
-        OpenApiParameter(
-            name="category",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by category ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="supplier",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by supplier ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="min_price",
-            type=OpenApiTypes.NUMBER,
-            location=OpenApiParameter.QUERY,
-            description="Filter by minimum unit price",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="max_price",
-            type=OpenApiTypes.NUMBER,
-            location=OpenApiParameter.QUERY,
-            description="Filter by maximum unit price",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="unit_type",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Filter by unit type (e.g., oz, ml, each)",
-            required=False,
-        ),
+        query_parameter("category", OpenApiTypes.INT, "Filter by category ID"),
+        query_parameter("supplier", OpenApiTypes.INT, "Filter by supplier ID"),
+        query_parameter("min_price", OpenApiTypes.NUMBER, "Filter by minimum unit price"),
+        query_parameter("max_price", OpenApiTypes.NUMBER, "Filter by maximum unit price"),
+        query_parameter("unit_type", OpenApiTypes.STR, "Filter by unit type (e.g., oz, ml, each)"),
     ]
     return inventory_params + product_params
 
 
+@cache
 def inventory_item_parameters() -> List[OpenApiParameter]:
     """
     Query parameters for inventory item-related endpoints.
     """
     inventory_params = inventory_parameters()
     inventory_item_params = [
-        OpenApiParameter(
-            name="product",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by product ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="location",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by location ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="min_quantity",
-            type=OpenApiTypes.NUMBER,
-            location=OpenApiParameter.QUERY,
-            description="Filter by minimum quantity",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="max_quantity",
-            type=OpenApiTypes.NUMBER,
-            location=OpenApiParameter.QUERY,
-            description="Filter by maximum quantity",
-            required=False,
-        ),
+        query_parameter("product", OpenApiTypes.INT, "Filter by product ID"),
+        query_parameter("location", OpenApiTypes.INT, "Filter by location ID"),
+        query_parameter("min_quantity", OpenApiTypes.NUMBER, "Filter by minimum quantity"),
+        query_parameter("max_quantity", OpenApiTypes.NUMBER, "Filter by maximum quantity"),
     ]
     return inventory_params + inventory_item_params
 
 
+@cache
 def transaction_parameters() -> List[OpenApiParameter]:
     """
     Query parameters for transaction-related endpoints.
     """
     inventory_params = inventory_parameters()
     transaction_params = [
-        OpenApiParameter(
-            name="product",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by product ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="location",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by location ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="transaction_type",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Filter by transaction type (received, sold, transferred, adjustment)",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="performed_by",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by user who performed the transaction",
-            required=False,
-        ),
+        query_parameter("product", OpenApiTypes.INT, "Filter by product ID"),
+        query_parameter("location", OpenApiTypes.INT, "Filter by location ID"),
+        query_parameter("transaction_type", OpenApiTypes.STR, "Filter by transaction type (received, sold, transferred, adjustment)"),
+        query_parameter("performed_by", OpenApiTypes.INT, "Filter by user who performed the transaction"),
     ]
     return inventory_params + transaction_params
 
 
+@cache
 def order_parameters() -> List[OpenApiParameter]:
     """
     Query parameters for order-related endpoints.
     """
     inventory_params = inventory_parameters()
     order_params = [
-        OpenApiParameter(
-            name="supplier",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by supplier ID",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="status",
-            type=OpenApiTypes.STR,
-            location=OpenApiParameter.QUERY,
-            description="Filter by order status (draft, pending, placed, received, cancelled)",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="created_by",
-            type=OpenApiTypes.INT,
-            location=OpenApiParameter.QUERY,
-            description="Filter by user who created the order",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="order_date_after",
-            type=OpenApiTypes.DATE,
-            location=OpenApiParameter.QUERY,
-            description="Filter by order date (after specified date)",
-            required=False,
-        ),
-        OpenApiParameter(
-            name="order_date_before",
-            type=OpenApiTypes.DATE,
-            location=OpenApiParameter.QUERY,
-            description="Filter by order date (before specified date)",
-            required=False,
-        ),
+        query_parameter("supplier", OpenApiTypes.INT, "Filter by supplier ID"),
+        query_parameter("status", OpenApiTypes.STR, "Filter by order status (draft, pending, placed, received, cancelled)"),
+        query_parameter("created_by", OpenApiTypes.INT, "Filter by user who created the order"),
+        query_parameter("order_date_after", OpenApiTypes.DATE, "Filter by order date (after specified date)"),
+        query_parameter("order_date_before", OpenApiTypes.DATE, "Filter by order date (before specified date)"),
     ]
     return inventory_params + order_params 
\ No newline at end of file
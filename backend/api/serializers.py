@@ -2,7 +2,26 @@
 API serializers for the CocktailAI project.
 """
 
+import copy
+import hmac
+import re
+from collections import Counter
+from decimal import Decimal
+from functools import partial
+from operator import attrgetter
+
+from django.db import IntegrityError, transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, F, Prefetch, Q, Sum
+from django.db.models.functions import Abs, Coalesce, NullIf
+from django.db.models.lookups import LessThan, LessThanOrEqual
+from django.utils.encoding import force_str
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.hashable import make_hashable
+from psycopg2.errorcodes import FOREIGN_KEY_VIOLATION, UNIQUE_VIOLATION
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+from rest_framework.validators import UniqueTogetherValidator
 
 # Import models as they are created
 # Example:
@@ -10,7 +29,7 @@ from rest_framework import serializers
 # from accounts.models import User
 
 # Import models
-from accounts.models import User, UserPreferences
+from accounts.models import User
 from inventory.models import Category, Supplier, Location, Product, InventoryItem, InventoryTransaction, InventoryCount, InventoryCountItem, Order, OrderItem
 
 # Serializer classes will be added here as models are created
@@ -59,36 +78,307 @@ from inventory.models import Category, Supplier, Location, Product, InventoryIte
 #         ]
 #         read_only_fields = ['created_at', 'updated_at']
 
-class UserPreferencesSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and hand out copies of them.
+    
+    ModelSerializer.get_fields() introspects the model on every instantiation,
+    although the result only depends on the class. Fields are shallow-copied
+    for each instance since binding sets attributes on them; nested
+    serializers and fields with a child are deep-copied, because their child
+    is bound to the copy that owns it.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = cls._cached_fields = super().get_fields()
+        return {
+            name: copy.deepcopy(field) if _has_bound_children(field) else copy.copy(field)
+            for name, field in fields.items()
+        }
+    
+    @cached_property
+    def _readable_fields(self):
+        # DRF re-filters the fields for every represented instance; list
+        # serializers share one child, so filter once per serializer instead
+        return [field for field in self.fields.values() if not field.write_only]
+
+
+def _has_bound_children(field):
+    return isinstance(field, (
+        serializers.BaseSerializer, serializers.ManyRelatedField,
+        serializers.ListField, serializers.DictField,
+    ))
+
+
+class FastReadOnlyField(serializers.ReadOnlyField):
+    """
+    ReadOnlyField that reads its source through a precompiled attrgetter.
+    
+    Values DRF would have to post-process (callables, dict instances, missing
+    attributes) fall back to the regular lookup.
+    """
+    
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        self._getter = attrgetter('.'.join(self.source_attrs)) if self.source_attrs else None
+    
+    def get_attribute(self, instance):
+        if self._getter is not None:
+            try:
+                value = self._getter(instance)
+            except AttributeError:
+                pass
+            else:
+                if not callable(value):
+                    return value
+        return super().get_attribute(instance)
+
+
+class ChoiceDisplayField(FastReadOnlyField):
+    """
+    Read-only display label of a model field with choices.
+    
+    Takes the choice field as source. The labels are collected once per bound
+    field, whereas get_FOO_display() rebuilds them from the choices per call.
+    """
+    
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        model_field = parent.Meta.model._meta.get_field(self.source)
+        self._labels = dict(make_hashable(model_field.flatchoices))
+    
+    def to_representation(self, value):
+        return force_str(self._labels.get(make_hashable(value), value), strings_only=True)
+
+
+class RowCacheMixin:
     """
-    Serializer for the UserPreferences model.
+    Reuse the representation of an object already rendered for the request.
+    
+    For serializers nested as single objects, where the same user, location or
+    supplier tends to recur (e.g. an order's creator and updater). The cache
+    lives in the serializer context, so it is scoped to one request. Rows of a
+    list are distinct objects and are not cached.
+    """
+    
+    @cached_property
+    def _row_cache(self):
+        # Resolved once per bound serializer; self.context walks up to the root
+        if isinstance(self.parent, serializers.ListSerializer):
+            return None
+        return self.context.setdefault('_row_cache', {}).setdefault(type(self), {})
+    
+    def to_representation(self, instance):
+        cache = self._row_cache
+        if cache is None or instance.pk is None:
+            return super().to_representation(instance)
+        key = (type(instance), instance.pk)
+        representation = cache.get(key)
+        if representation is None:
+            representation = cache[key] = super().to_representation(instance)
+        return representation.copy()
+
+
+class ValuesListMixin:
+    """
+    Render list rows from queryset.values() instead of model instances.
+    
+    values_rows() selects every field as a dict key: model fields and
+    existing annotations by name, the rest through values_expressions,
+    which maps field names to the expressions computing them. The dicts are
+    formatted by the fields' own to_representation, so the output matches
+    that of instances without building them. Instances are still rendered
+    as usual.
     """
+    values_expressions = {}
+    
+    @classmethod
+    def values_rows(cls, queryset):
+        """
+        Return the queryset as dicts keyed by the serializer's field names.
+        """
+        names = [name for name in cls.Meta.fields if name not in cls.values_expressions]
+        return queryset.values(*names, **cls.values_expressions)
+    
+    @cached_property
+    def _values_formatters(self):
+        """
+        Pair each readable field's name with the function formatting its value.
+        
+        The function is None for read-only fields, which return values as is.
+        """
+        formatters = []
+        for field in self._readable_fields:
+            to_representation = field.to_representation
+            if type(field).to_representation is serializers.ReadOnlyField.to_representation:
+                to_representation = None
+            elif isinstance(field, serializers.FileField):
+                # FileField renders the FieldFile's url, values() only has its name
+                model_field = self.Meta.model._meta.get_field(field.source)
+                to_representation = partial(_file_to_representation, field, model_field)
+            formatters.append((field.field_name, to_representation))
+        return formatters
+    
+    def to_representation(self, instance):
+        if not isinstance(instance, dict):
+            return super().to_representation(instance)
+        ret = {}
+        for name, to_representation in self._values_formatters:
+            value = instance[name]
+            ret[name] = value if value is None or to_representation is None else to_representation(value)
+        return ret
+
+
+# The first column of a constraint violation's "Key (...)=(...)" detail
+CONSTRAINT_KEY_RE = re.compile(r'Key \((?P<column>\w+)')
+
+
+def _file_to_representation(field, model_field, name):
+    return field.to_representation(model_field.attr_class(None, model_field, name))
+
+
+class ForeignKeyIdMixin:
+    """
+    Report writes through unknown `<relation>_id` values as validation errors.
+    
+    The write-only id fields are plain IntegerFields on the foreign key
+    column, so ids aren't looked up while validating; the foreign key
+    constraints check them when the row is saved instead. The save runs in
+    its own atomic block. The constraints are deferred to the end of the
+    transaction, so inside an outer transaction their pending checks are
+    run before the block is left.
+    
+    Unique violations are reported as unique_violation_message when it is
+    set. They happen when a concurrent request writes the same row between
+    the unique validators' check and the save.
+    
+    Both are reported under the field writing the violating column.
+    """
+    unique_violation_message = None
+    
+    def save(self, **kwargs):
+        connection = transaction.get_connection()
+        check_constraints = connection.in_atomic_block
+        try:
+            with transaction.atomic():
+                instance = super().save(**kwargs)
+                if check_constraints:
+                    # Switching to IMMEDIATE runs the pending checks now
+                    with connection.cursor() as cursor:
+                        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE; SET CONSTRAINTS ALL DEFERRED')
+                return instance
+        except IntegrityError as exc:
+            pgcode = getattr(exc.__cause__, 'pgcode', None)
+            if pgcode == FOREIGN_KEY_VIOLATION:
+                message = "A referenced object does not exist."
+            elif pgcode == UNIQUE_VIOLATION and self.unique_violation_message:
+                message = self.unique_violation_message
+            else:
+                raise
+            raise serializers.ValidationError({self.violation_field(exc.__cause__): [message]})
+    
+    def violation_field(self, error):
+        """
+        Return the name of the field writing the column a database error is about.
+        
+        The column is read from the error detail, e.g. "Key (location_id)=(9)
+        is not present in table ...". Falls back to the non-field errors key.
+        """
+        match = CONSTRAINT_KEY_RE.match(getattr(error.diag, 'message_detail', None) or '')
+        if match:
+            fields = getattr(self, 'child', self).fields
+            for field in fields.values():
+                if field.source == match['column']:
+                    return field.field_name
+        return api_settings.NON_FIELD_ERRORS_KEY
+
+
+class FieldUniqueTogetherValidator(UniqueTogetherValidator):
+    """
+    UniqueTogetherValidator reporting duplicates under its first field.
+    
+    Matches the errors ForeignKeyIdMixin gives for unique violations that
+    slip past the check.
+    """
+    
+    def __call__(self, attrs, serializer):
+        try:
+            super().__call__(attrs, serializer)
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({self.fields[0]: exc.detail})
+
+
+class UserPreferencesSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for a user's preferences.
+    Flattens the User.preferences JSON next to the preference columns.
+    """
+    date_format = serializers.CharField(source='preferences.date_format', max_length=20, required=False)
+    time_format = serializers.CharField(source='preferences.time_format', max_length=20, required=False)
+    timezone = serializers.CharField(source='preferences.timezone', max_length=50, required=False)
+    
     class Meta:
-        model = UserPreferences
-        fields = [
+        model = User
+        fields = (
             'id', 'items_per_page', 'default_view', 
             'low_stock_alerts', 'order_status_notifications', 'inventory_count_reminders',
             'date_format', 'time_format', 'timezone'
-        ]
+        )
+    
+    def update(self, instance, validated_data):
+        """
+        Update the preferences, merging JSON keys into User.preferences.
+        """
+        preferences_data = validated_data.pop('preferences', None)
+        if preferences_data:
+            validated_data['preferences'] = {**instance.preferences, **preferences_data}
+        return super().update(instance, validated_data)
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(RowCacheMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the User model.
     """
-    preferences = UserPreferencesSerializer(read_only=True)
+    preferences = UserPreferencesSerializer(source='*', read_only=True)
     
     class Meta:
         model = User
-        fields = [
+        fields = (
             'id', 'username', 'email', 'first_name', 'last_name',
             'phone_number', 'position', 'bio', 'profile_image',
             'notification_email', 'notification_sms', 'dark_mode',
             'company_name', 'location', 'date_updated', 'preferences'
-        ]
-        read_only_fields = ['date_updated']
+        )
+        read_only_fields = ('date_updated',)
         extra_kwargs = {'password': {'write_only': True}}
 
-class UserCreateSerializer(serializers.ModelSerializer):
+class UserMiniSerializer(RowCacheMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for users nested in other representations.
+    Only identifies the user; the profile and preferences are left out.
+    """
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'first_name', 'last_name')
+        read_only_fields = fields
+
+class UserListSerializer(UserSerializer):
+    """
+    Serializer for listing User instances.
+    Leaves out the biography and profile image, which are only needed on detail views.
+    """
+    class Meta(UserSerializer.Meta):
+        fields = (
+            'id', 'username', 'email', 'first_name', 'last_name',
+            'phone_number', 'position',
+            'notification_email', 'notification_sms', 'dark_mode',
+            'company_name', 'location', 'date_updated', 'preferences'
+        )
+        read_only_fields = fields
+
+class UserCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating User instances.
     Handles password hashing.
@@ -98,17 +388,17 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = [
+        fields = (
             'id', 'username', 'email', 'password', 'password_confirm',
             'first_name', 'last_name', 'phone_number', 'position',
             'company_name', 'location'
-        ]
+        )
 
     def validate(self, data):
         """
-        Check that the passwords match.
+        Check that the passwords match, in constant time.
         """
-        if data['password'] != data['password_confirm']:
+        if not hmac.compare_digest(data['password'].encode(), data['password_confirm'].encode()):
             raise serializers.ValidationError({"password_confirm": "Passwords do not match."})
         return data
 
@@ -116,9 +406,6 @@ class UserCreateSerializer(serializers.ModelSerializer):
         """
         Create and return a new user with encrypted password.
         """
-        # Remove password_confirm from validated data
-        validated_data.pop('password_confirm', None)
-        
         # Create the user with create_user to handle password hashing
         user = User.objects.create_user(
             username=validated_data['username'],
@@ -135,397 +422,386 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return user
 
 # Inventory serializers
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(RowCacheMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Category model.
     """
     class Meta:
         model = Category
-        fields = ['id', 'name', 'description', 'is_active', 'created_at', 'updated_at']
-        read_only_fields = ['created_at', 'updated_at']
+        fields = ('id', 'name', 'description', 'is_active', 'created_at', 'updated_at')
+        read_only_fields = ('created_at', 'updated_at')
 
 
-class SupplierSerializer(serializers.ModelSerializer):
+class SupplierSerializer(RowCacheMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Supplier model.
     """
     class Meta:
         model = Supplier
-        fields = [
+        fields = (
             'id', 'name', 'contact_name', 'email', 'phone', 
             'address', 'website', 'notes', 'is_active', 
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
 
 
-class LocationSerializer(serializers.ModelSerializer):
+class LocationSerializer(RowCacheMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Location model.
     """
     class Meta:
         model = Location
-        fields = [
+        fields = (
             'id', 'name', 'description', 'is_storage', 
             'is_service', 'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
 
 # Additional inventory serializers will be added here 
 
 # Product serializers
-class ProductSerializer(serializers.ModelSerializer):
+class ProductListSerializer(ValuesListMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Base serializer for Product instances.
-    Handles all product operations with conditional field inclusion
-    based on context or action.
+    Serializer for listing Product instances.
+    Refers to the category and supplier by id and name.
     """
-    # Fields for list view
-    category_name = serializers.ReadOnlyField(source='category.name')
-    supplier_name = serializers.ReadOnlyField(source='supplier.name')
-    total_quantity = serializers.ReadOnlyField()
-    total_value = serializers.ReadOnlyField()
-    below_par_level = serializers.ReadOnlyField()
-    needs_reorder = serializers.ReadOnlyField()
-    
-    # Fields for detail view
-    category = serializers.SerializerMethodField()
-    supplier = serializers.SerializerMethodField()
-    category_id = serializers.PrimaryKeyRelatedField(
-        source='category',
-        queryset=Category.objects.all(),
+    category = FastReadOnlyField(source='category_id')
+    category_name = FastReadOnlyField(source='category.name')
+    supplier = FastReadOnlyField(source='supplier_id')
+    supplier_name = FastReadOnlyField(source='supplier.name')
+    total_quantity = FastReadOnlyField()
+    total_value = FastReadOnlyField()
+    below_par_level = FastReadOnlyField()
+    needs_reorder = FastReadOnlyField()
+    
+    # Fields that aren't columns or annotations, for values_rows()
+    values_expressions = {
+        'category_name': F('category__name'),
+        'supplier_name': F('supplier__name'),
+        'total_value': F('total_quantity') * F('unit_price'),
+        'below_par_level': LessThan(F('total_quantity'), F('par_level')),
+        'needs_reorder': LessThanOrEqual(F('total_quantity'), F('reorder_point')),
+    }
+    
+    class Meta:
+        model = Product
+        fields = (
+            'id', 'name', 'sku', 'barcode', 'image',
+            'category', 'category_name', 'supplier', 'supplier_name',
+            'unit_price', 'unit_size', 'unit_type',
+            'par_level', 'reorder_point', 'reorder_quantity',
+            'total_quantity', 'total_value', 'below_par_level', 'needs_reorder',
+            'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the related objects read by the representation.
+        
+        total_quantity is annotated so that it and the stock figures derived
+        from it come with the products in one query.
+        """
+        return queryset.select_related('category', 'supplier').annotate(
+            total_quantity=Coalesce(Sum('inventory_items__quantity'), Decimal(0))
+        )
+
+
+class ProductDetailSerializer(ProductListSerializer):
+    """
+    Serializer for detailed Product information.
+    Nests the full category and supplier.
+    """
+    category = CategorySerializer(read_only=True)
+    supplier = SupplierSerializer(read_only=True)
+    
+    class Meta(ProductListSerializer.Meta):
+        fields = (
+            'id', 'name', 'sku', 'description', 'barcode', 'image',
+            'category', 'category_name', 'supplier', 'supplier_name',
+            'unit_price', 'unit_size', 'unit_type',
+            'par_level', 'reorder_point', 'reorder_quantity',
+            'notes', 'total_quantity', 'total_value', 
+            'below_par_level', 'needs_reorder',
+            'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = fields
+
+
+class ProductCreateUpdateSerializer(ForeignKeyIdMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for creating and updating Product instances.
+    Takes the category and supplier by id.
+    """
+    category_id = serializers.IntegerField(
         write_only=True,
         required=False
     )
-    supplier_id = serializers.PrimaryKeyRelatedField(
-        source='supplier',
-        queryset=Supplier.objects.all(),
+    supplier_id = serializers.IntegerField(
         write_only=True,
         required=False
     )
     
     class Meta:
         model = Product
-        fields = [
+        fields = (
             'id', 'name', 'sku', 'description', 'barcode', 'image',
-            'category', 'category_id', 'category_name', 
-            'supplier', 'supplier_id', 'supplier_name',
+            'category_id', 'supplier_id',
             'unit_price', 'unit_size', 'unit_type',
             'par_level', 'reorder_point', 'reorder_quantity',
-            'notes', 'total_quantity', 'total_value', 
-            'below_par_level', 'needs_reorder',
-            'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+            'notes', 'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
-    def __init__(self, *args, **kwargs):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Initialize the serializer with dynamic field sets based on context.
+        Writes don't render related objects, so there is nothing to load.
         """
-        super().__init__(*args, **kwargs)
-        
-        # Get the request context to determine which fields to include
-        request = self.context.get('request')
-        if not request:
-            return
-            
-        # For list action, exclude detailed fields
-        if self.context.get('view') and self.context['view'].action == 'list':
-            self.fields.pop('description', None)
-            self.fields.pop('notes', None)
-            
-        # For create/update actions, use simplified representation of category and supplier
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            self.fields.pop('category', None)
-            self.fields.pop('supplier', None)
-            self.fields.pop('category_name', None)
-            self.fields.pop('supplier_name', None)
-            self.fields.pop('total_quantity', None)
-            self.fields.pop('total_value', None)
-            self.fields.pop('below_par_level', None)
-            self.fields.pop('needs_reorder', None)
-        else:  # For GET requests
-            self.fields.pop('category_id', None)
-            self.fields.pop('supplier_id', None)
-    
-    def get_category(self, obj):
-        """
-        Return the full CategorySerializer representation for detail view.
-        """
-        # Only return detailed category in detail view
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return CategorySerializer(obj.category).data
-        return obj.category_id
-        
-    def get_supplier(self, obj):
+        return queryset
+
+
+# InventoryItem serializers
+class InventoryItemListSerializer(ValuesListMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for listing InventoryItem instances.
+    Refers to the product and location by id and name.
+    """
+    product = FastReadOnlyField(source='product_id')
+    product_name = FastReadOnlyField(source='product.name')
+    location = FastReadOnlyField(source='location_id')
+    location_name = FastReadOnlyField(source='location.name')
+    value = FastReadOnlyField()
+    
+    # Fields that aren't columns or annotations, for values_rows()
+    values_expressions = {
+        'product_name': F('product__name'),
+        'location_name': F('location__name'),
+        'value': F('quantity') * F('product__unit_price'),
+    }
+    
+    class Meta:
+        model = InventoryItem
+        fields = (
+            'id', 'product', 'product_name', 'location', 'location_name',
+            'quantity', 'value', 'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Return the full SupplierSerializer representation for detail view.
+        Load the product and location read by the representation.
         """
-        # Only return detailed supplier in detail view
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return SupplierSerializer(obj.supplier).data
-        return obj.supplier_id
+        return queryset.select_related('product', 'location')
 
 
-# Keeping these aliases for backward compatibility during transition
-ProductListSerializer = ProductSerializer
-ProductDetailSerializer = ProductSerializer
-ProductCreateUpdateSerializer = ProductSerializer
+class InventoryItemDetailSerializer(InventoryItemListSerializer):
+    """
+    Serializer for detailed InventoryItem information.
+    Nests the product and location.
+    """
+    product = ProductListSerializer(read_only=True)
+    location = LocationSerializer(read_only=True)
+    
+    class Meta(InventoryItemListSerializer.Meta):
+        pass
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the product, with its category and supplier, and the location.
+        """
+        return queryset.select_related('product__category', 'product__supplier', 'location')
 
 
-# InventoryItem serializers
-class InventoryItemSerializer(serializers.ModelSerializer):
+class InventoryItemCreateUpdateSerializer(ForeignKeyIdMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Base serializer for InventoryItem instances.
-    Handles all inventory item operations with conditional field inclusion
-    based on context or action.
+    Serializer for creating and updating InventoryItem instances.
+    Takes the product and location by id.
     """
-    # Fields for list view
-    product_name = serializers.ReadOnlyField(source='product.name')
-    location_name = serializers.ReadOnlyField(source='location.name')
-    value = serializers.ReadOnlyField()
-    
-    # Fields for detail view
-    product = serializers.SerializerMethodField()
-    location = serializers.SerializerMethodField()
-    product_id = serializers.PrimaryKeyRelatedField(
-        source='product',
-        queryset=Product.objects.all(),
+    product_id = serializers.IntegerField(
         write_only=True
     )
-    location_id = serializers.PrimaryKeyRelatedField(
-        source='location',
-        queryset=Location.objects.all(),
+    location_id = serializers.IntegerField(
         write_only=True
     )
     
+    unique_violation_message = "An inventory item for this product and location already exists."
+    
     class Meta:
         model = InventoryItem
-        fields = [
-            'id', 'product', 'product_id', 'product_name', 
-            'location', 'location_id', 'location_name',
-            'quantity', 'value', 'is_active', 'created_at', 'updated_at'
+        fields = (
+            'id', 'product_id', 'location_id',
+            'quantity', 'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = ('created_at', 'updated_at')
+        # Checks the model's product/location unique constraint with one query
+        validators = [
+            FieldUniqueTogetherValidator(
+                queryset=InventoryItem.objects.all(),
+                fields=['product_id', 'location_id'],
+                message="An inventory item for this product and location already exists."
+            )
         ]
-        read_only_fields = ['created_at', 'updated_at']
-
-    def __init__(self, *args, **kwargs):
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Initialize the serializer with dynamic field sets based on context.
+        Writes don't render related objects, so there is nothing to load.
         """
-        super().__init__(*args, **kwargs)
-        
-        # Get the request context to determine which fields to include
-        request = self.context.get('request')
-        if not request:
-            return
-            
-        # For create/update actions, use simplified representation
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            self.fields.pop('product', None)
-            self.fields.pop('location', None)
-            self.fields.pop('product_name', None)
-            self.fields.pop('location_name', None)
-            self.fields.pop('value', None)
-        else:  # For GET requests
-            self.fields.pop('product_id', None)
-            self.fields.pop('location_id', None)
-
-    def get_product(self, obj):
-        """
-        Return the full ProductSerializer representation for detail view.
-        """
-        # Only return detailed product in detail view
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return ProductSerializer(obj.product).data
-        return obj.product_id
-        
-    def get_location(self, obj):
+        return queryset
+
+
+# InventoryTransaction serializers
+class InventoryTransactionListSerializer(ValuesListMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for listing InventoryTransaction instances.
+    Refers to the related objects by id and name.
+    """
+    transaction_type_display = ChoiceDisplayField(source='transaction_type')
+    product = FastReadOnlyField(source='product_id')
+    product_name = FastReadOnlyField(source='product.name')
+    location = FastReadOnlyField(source='location_id')
+    location_name = FastReadOnlyField(source='location.name')
+    destination_location = FastReadOnlyField(source='destination_location_id')
+    destination_location_name = FastReadOnlyField(source='destination_location.name')
+    performed_by = FastReadOnlyField(source='performed_by_id')
+    performed_by_username = FastReadOnlyField(source='performed_by.username')
+    total_value = FastReadOnlyField()
+    
+    # Fields that aren't columns or annotations, for values_rows()
+    values_expressions = {
+        'transaction_type_display': F('transaction_type'),
+        'product_name': F('product__name'),
+        'location_name': F('location__name'),
+        'destination_location_name': F('destination_location__name'),
+        'performed_by_username': F('performed_by__username'),
+        'total_value': Abs('quantity') * F('unit_price'),
+    }
+    
+    class Meta:
+        model = InventoryTransaction
+        fields = (
+            'id', 'transaction_id', 'transaction_type', 'transaction_type_display',
+            'product', 'product_name', 'location', 'location_name',
+            'destination_location', 'destination_location_name',
+            'quantity', 'unit_price', 'reference',
+            'performed_by', 'performed_by_username', 'total_value',
+            'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Return the full LocationSerializer representation for detail view.
+        Load the related objects read by the representation.
         """
-        # Only return detailed location in detail view
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return LocationSerializer(obj.location).data
-        return obj.location_id
+        return queryset.select_related('product', 'location', 'destination_location', 'performed_by')
+
+
+class InventoryTransactionDetailSerializer(InventoryTransactionListSerializer):
+    """
+    Serializer for detailed InventoryTransaction information.
+    Nests the related objects.
+    """
+    product = ProductListSerializer(read_only=True)
+    location = LocationSerializer(read_only=True)
+    destination_location = LocationSerializer(read_only=True)
+    performed_by = UserMiniSerializer(read_only=True)
     
-    def validate(self, data):
+    class Meta(InventoryTransactionListSerializer.Meta):
+        fields = (
+            'id', 'transaction_id', 'transaction_type', 'transaction_type_display',
+            'product', 'product_name', 'location', 'location_name',
+            'destination_location', 'destination_location_name',
+            'quantity', 'unit_price', 'reference', 'notes',
+            'performed_by', 'performed_by_username', 'total_value',
+            'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Validate that the product-location combination is unique.
+        Load the related objects, and the product's category and supplier.
         """
-        product = data.get('product')
-        location = data.get('location')
-        
-        # Check if we're creating a new object or updating an existing one
-        instance = self.instance
-        
-        # If instance is None, we're creating a new object
-        if instance is None:
-            if InventoryItem.objects.filter(product=product, location=location).exists():
-                raise serializers.ValidationError(
-                    {"non_field_errors": "An inventory item for this product and location already exists."}
-                )
-                
-        # If instance is not None, we're updating an existing object
-        else:
-            # If we're changing the product or location
-            if (product != instance.product or location != instance.location):
-                if InventoryItem.objects.filter(product=product, location=location).exists():
-                    raise serializers.ValidationError(
-                        {"non_field_errors": "An inventory item for this product and location already exists."}
-                    )
-        
-        return data
+        return queryset.select_related(
+            'product__category', 'product__supplier',
+            'location', 'destination_location', 'performed_by'
+        )
 
 
-# Keeping these aliases for backward compatibility during transition
-InventoryItemListSerializer = InventoryItemSerializer
-InventoryItemDetailSerializer = InventoryItemSerializer
-InventoryItemCreateUpdateSerializer = InventoryItemSerializer
+# Transaction type -> sign its quantity must have, and the check for it
+QUANTITY_SIGN_RULES = {
+    'sold': ('negative', lambda quantity: quantity < 0),
+    'transferred': ('negative', lambda quantity: quantity < 0),
+    'received': ('positive', lambda quantity: quantity > 0),
+}
 
 
-# InventoryTransaction serializers
-class InventoryTransactionSerializer(serializers.ModelSerializer):
+class InventoryTransactionCreateSerializer(ForeignKeyIdMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Base serializer for InventoryTransaction instances.
-    Handles all inventory transaction operations with conditional field inclusion
-    based on context or action.
+    Serializer for creating and updating InventoryTransaction instances.
+    Takes the product and locations by id.
     """
-    # Fields for list view
-    product_name = serializers.ReadOnlyField(source='product.name')
-    location_name = serializers.ReadOnlyField(source='location.name')
-    destination_location_name = serializers.ReadOnlyField(source='destination_location.name')
-    transaction_type_display = serializers.ReadOnlyField(source='get_transaction_type_display')
-    performed_by_username = serializers.ReadOnlyField(source='performed_by.username')
-    total_value = serializers.ReadOnlyField()
-    
-    # Fields for detail view
-    product = serializers.SerializerMethodField()
-    location = serializers.SerializerMethodField()
-    destination_location = serializers.SerializerMethodField()
-    performed_by = serializers.SerializerMethodField()
-    
-    # Write-only fields for related objects
-    product_id = serializers.PrimaryKeyRelatedField(
-        source='product',
-        queryset=Product.objects.all(),
+    product_id = serializers.IntegerField(
         write_only=True
     )
-    location_id = serializers.PrimaryKeyRelatedField(
-        source='location',
-        queryset=Location.objects.all(),
+    location_id = serializers.IntegerField(
         write_only=True
     )
-    destination_location_id = serializers.PrimaryKeyRelatedField(
-        source='destination_location',
-        queryset=Location.objects.all(),
+    destination_location_id = serializers.IntegerField(
         write_only=True,
         required=False
     )
     
     class Meta:
         model = InventoryTransaction
-        fields = [
-            'id', 'transaction_id', 'transaction_type', 'transaction_type_display',
-            'product', 'product_id', 'product_name', 
-            'location', 'location_id', 'location_name',
-            'destination_location', 'destination_location_id', 'destination_location_name',
-            'quantity', 'unit_price', 'reference', 'notes', 
-            'performed_by', 'performed_by_username', 'total_value',
+        fields = (
+            'id', 'transaction_id', 'transaction_type',
+            'product_id', 'location_id', 'destination_location_id',
+            'quantity', 'unit_price', 'reference', 'notes',
             'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['transaction_id', 'created_at', 'updated_at']
-
-    def __init__(self, *args, **kwargs):
+        )
+        read_only_fields = ('transaction_id', 'created_at', 'updated_at')
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        Initialize the serializer with dynamic field sets based on context.
+        Writes don't render related objects, so there is nothing to load.
         """
-        super().__init__(*args, **kwargs)
-        
-        # Get the request context to determine which fields to include
-        request = self.context.get('request')
-        if not request:
-            return
-            
-        # For list action, exclude detailed fields
-        if self.context.get('view') and self.context['view'].action == 'list':
-            self.fields.pop('notes', None)
-            
-        # For create/update actions, use simplified representation
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            self.fields.pop('product', None)
-            self.fields.pop('location', None)
-            self.fields.pop('destination_location', None)
-            self.fields.pop('performed_by', None)
-            self.fields.pop('product_name', None)
-            self.fields.pop('location_name', None)
-            self.fields.pop('destination_location_name', None)
-            self.fields.pop('transaction_type_display', None)
-            self.fields.pop('performed_by_username', None)
-            self.fields.pop('total_value', None)
-        else:  # For GET requests
-            self.fields.pop('product_id', None)
-            self.fields.pop('location_id', None)
-            self.fields.pop('destination_location_id', None)
-
-    def get_product(self, obj):
-        """Return the full ProductSerializer representation for detail view."""
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return ProductSerializer(obj.product).data
-        return obj.product_id
-        
-    def get_location(self, obj):
-        """Return the full LocationSerializer representation for detail view."""
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return LocationSerializer(obj.location).data
-        return obj.location_id
-        
-    def get_destination_location(self, obj):
-        """Return the full LocationSerializer representation for the destination location."""
-        if obj.destination_location and self.context.get('view') and self.context['view'].action == 'retrieve':
-            return LocationSerializer(obj.destination_location).data
-        return None
-    
-    def get_performed_by(self, obj):
-        """Return the full UserSerializer representation for performed_by."""
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return UserSerializer(obj.performed_by).data
-        return obj.performed_by_id
-        
+        return queryset
+    
     def validate(self, data):
         """
         Validate transaction data based on transaction type.
         
-        - For 'sold' and 'transferred' transactions: quantity must be negative
-        - For 'received' and 'adjustment' transactions: quantity must be positive
+        - Quantities must have the sign QUANTITY_SIGN_RULES gives for the type
         - For 'transferred' transactions: destination_location must be provided
         """
         transaction_type = data.get('transaction_type')
         quantity = data.get('quantity')
-        destination_location = data.get('destination_location')
+        destination_location_id = data.get('destination_location_id')
         
-        # For 'sold' and 'transferred' transactions, quantity should be negative
-        if transaction_type in ['sold', 'transferred'] and quantity >= 0:
+        rule = QUANTITY_SIGN_RULES.get(transaction_type)
+        if rule is not None and not rule[1](quantity):
             raise serializers.ValidationError({
-                "quantity": f"Quantity must be negative for {transaction_type} transactions."
-            })
-            
-        # For 'received' transactions, quantity should be positive
-        elif transaction_type == 'received' and quantity <= 0:
-            raise serializers.ValidationError({
-                "quantity": "Quantity must be positive for received transactions."
+                "quantity": f"Quantity must be {rule[0]} for {transaction_type} transactions."
             })
             
         # Validate transfer operations
         if transaction_type == 'transferred':
             # Ensure destination_location is provided for transfers
-            if not destination_location:
+            if not destination_location_id:
                 raise serializers.ValidationError({
                     "destination_location_id": "Destination location is required for transfers."
                 })
             
             # Ensure destination_location is not the same as source location
-            location = data.get('location')
-            if destination_location == location:
+            if destination_location_id == data.get('location_id'):
                 raise serializers.ValidationError({
                     "destination_location_id": "Destination location must be different from source location."
                 })
@@ -533,112 +809,161 @@ class InventoryTransactionSerializer(serializers.ModelSerializer):
         return data
 
 
-# Keeping these aliases for backward compatibility during transition
-InventoryTransactionListSerializer = InventoryTransactionSerializer
-InventoryTransactionDetailSerializer = InventoryTransactionSerializer
-InventoryTransactionCreateSerializer = InventoryTransactionSerializer
-
-
 # InventoryCount serializers
-class InventoryCountItemSerializer(serializers.ModelSerializer):
+class InventoryCountItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for InventoryCountItem instances.
     """
-    product_name = serializers.ReadOnlyField(source='product.name')
-    variance = serializers.ReadOnlyField()
-    variance_percentage = serializers.ReadOnlyField()
-    counted_by_username = serializers.SerializerMethodField()
+    product_name = FastReadOnlyField(source='product.name')
+    variance = FastReadOnlyField()
+    variance_percentage = FastReadOnlyField()
+    counted_by_username = FastReadOnlyField(source='counted_by.username', default=None)
     
     class Meta:
         model = InventoryCountItem
-        fields = [
+        fields = (
             'id', 'product', 'product_name', 'expected_quantity',
             'counted_quantity', 'is_counted', 'variance', 'variance_percentage',
             'counted_by', 'counted_by_username', 'counted_at', 'notes'
-        ]
-        read_only_fields = ['expected_quantity', 'counted_at']
-        
-    def get_counted_by_username(self, obj):
-        """Get the username of the user who counted this item."""
-        if obj.counted_by:
-            return obj.counted_by.username
-        return None
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the product and counting user read by the representation.
+        """
+        return queryset.select_related('product', 'counted_by')
+
 
+def annotate_count_progress(queryset):
+    """
+    Annotate inventory counts with their total_items and completed_items.
+    """
+    return queryset.annotate(
+        total_items=Count('count_items'),
+        completed_items=Count('count_items', filter=Q(count_items__is_counted=True)),
+    )
 
-class InventoryCountListSerializer(serializers.ModelSerializer):
+
+class InventoryCountListSerializer(ValuesListMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for listing InventoryCount instances.
+    Refers to the location and users by id and name.
     """
-    location_name = serializers.ReadOnlyField(source='location.name')
-    status_display = serializers.ReadOnlyField(source='get_status_display')
-    created_by_username = serializers.ReadOnlyField(source='created_by.username')
-    completed_by_username = serializers.SerializerMethodField()
-    progress_percentage = serializers.ReadOnlyField()
+    location = FastReadOnlyField(source='location_id')
+    location_name = FastReadOnlyField(source='location.name')
+    status_display = ChoiceDisplayField(source='status')
+    created_by = FastReadOnlyField(source='created_by_id')
+    created_by_username = FastReadOnlyField(source='created_by.username')
+    completed_by = FastReadOnlyField(source='completed_by_id')
+    completed_by_username = FastReadOnlyField(source='completed_by.username', default=None)
+    progress_percentage = FastReadOnlyField()
+    
+    # Fields that aren't columns or annotations, for values_rows()
+    values_expressions = {
+        'location_name': F('location__name'),
+        'status_display': F('status'),
+        'created_by_username': F('created_by__username'),
+        'completed_by_username': F('completed_by__username'),
+        # Integer division truncates like int() in progress_percentage
+        'progress_percentage': Coalesce(
+            F('completed_items') * 100 / NullIf(F('total_items'), 0), 0
+        ),
+    }
     
     class Meta:
         model = InventoryCount
-        fields = [
+        fields = (
             'id', 'count_id', 'name', 'location', 'location_name',
             'status', 'status_display', 'scheduled_date', 'completed_date',
             'created_by', 'created_by_username', 'completed_by', 'completed_by_username',
             'progress_percentage', 'total_items', 'completed_items',
             'created_at'
-        ]
-        read_only_fields = ['count_id', 'created_at', 'progress_percentage', 
-                           'total_items', 'completed_items']
-                           
-    def get_completed_by_username(self, obj):
-        """Get the username of the user who completed this count."""
-        if obj.completed_by:
-            return obj.completed_by.username
-        return None
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the location and users read by the list representation.
+        
+        The item numbers are annotated so that they and the progress come
+        with the counts in one query.
+        """
+        return annotate_count_progress(
+            queryset.select_related('location', 'created_by', 'completed_by')
+        )
 
 
-class InventoryCountDetailSerializer(serializers.ModelSerializer):
+class InventoryCountDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for detailed InventoryCount information.
     """
     location = LocationSerializer(read_only=True)
-    created_by = UserSerializer(read_only=True)
-    completed_by = UserSerializer(read_only=True)
-    status_display = serializers.ReadOnlyField(source='get_status_display')
+    created_by = UserMiniSerializer(read_only=True)
+    completed_by = UserMiniSerializer(read_only=True)
+    status_display = ChoiceDisplayField(source='status')
     count_items = InventoryCountItemSerializer(many=True, read_only=True)
-    progress_percentage = serializers.ReadOnlyField()
-    total_items = serializers.ReadOnlyField()
-    completed_items = serializers.ReadOnlyField()
+    progress_percentage = FastReadOnlyField()
+    total_items = FastReadOnlyField()
+    completed_items = FastReadOnlyField()
     
     class Meta:
         model = InventoryCount
-        fields = [
+        fields = (
             'id', 'count_id', 'name', 'description', 'location',
             'status', 'status_display', 'scheduled_date', 'completed_date',
             'created_by', 'completed_by', 'notes', 'progress_percentage',
             'total_items', 'completed_items', 'count_items',
             'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['count_id', 'created_at', 'updated_at', 
-                           'progress_percentage', 'total_items', 'completed_items']
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the location, users and count items read by the detail representation.
+        """
+        return annotate_count_progress(queryset).select_related(
+            'location', 'created_by', 'completed_by'
+        ).prefetch_related(
+            Prefetch('count_items', queryset=InventoryCountItemSerializer.setup_eager_loading(InventoryCountItem.objects.all()))
+        )
 
 
-class InventoryCountCreateUpdateSerializer(serializers.ModelSerializer):
+class InventoryCountCreateUpdateSerializer(ForeignKeyIdMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating and updating InventoryCount instances.
+    Takes the location and users by id.
     """
+    location = serializers.IntegerField(source='location_id')
+    # Set to the requesting user on create
+    created_by = serializers.IntegerField(source='created_by_id', required=False)
+    completed_by = serializers.IntegerField(source='completed_by_id', required=False, allow_null=True)
+    
     class Meta:
         model = InventoryCount
-        fields = [
+        fields = (
             'name', 'description', 'location', 'status',
             'scheduled_date', 'completed_date', 'created_by',
             'completed_by', 'notes', 'is_active'
-        ]
+        )
         
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Writes don't render related objects, so there is nothing to load.
+        """
+        return queryset
+    
     def validate(self, data):
         """
         Validate inventory count data.
         """
         status = data.get('status')
         completed_date = data.get('completed_date')
-        completed_by = data.get('completed_by')
+        completed_by = data.get('completed_by_id')
         
         # If status is 'completed', check that completed_date and completed_by are provided
         if status == 'completed':
@@ -661,23 +986,88 @@ class InventoryCountCreateUpdateSerializer(serializers.ModelSerializer):
         return data
 
 
-class InventoryCountItemUpdateSerializer(serializers.ModelSerializer):
+class InventoryCountItemIdSerializer(serializers.Serializer):
+    """
+    Serializer reading the item id of each entry of a bulk count update.
+    """
+    id = serializers.IntegerField()
+
+
+class InventoryCountItemBulkUpdateSerializer(ForeignKeyIdMixin, serializers.ListSerializer):
+    """
+    Serializer for updating many InventoryCountItem instances at once.
+    Takes the items in the order of the submitted data and saves them
+    with a single bulk UPDATE.
+    """
+    
+    def validate(self, data):
+        """
+        Validate each item's data against the item it updates.
+        """
+        errors = []
+        for instance, attrs in zip(self.instance, data):
+            try:
+                self.child.validate_counted(attrs, instance)
+            except serializers.ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                errors.append({})
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return data
+    
+    def update(self, instances, validated_data):
+        """
+        Update the items in memory and write all of them in one query.
+        
+        bulk_update() skips save(), so updated_at is set here.
+        """
+        now = timezone.now()
+        fields = {'updated_at'}
+        for instance, attrs in zip(instances, validated_data):
+            # If marking as counted, set the counted_at timestamp
+            if attrs.get('is_counted') and not instance.is_counted:
+                attrs['counted_at'] = now
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+            instance.updated_at = now
+            fields.update(attrs)
+        
+        InventoryCountItem.objects.bulk_update(instances, fields, batch_size=500)
+        return instances
+
+
+class InventoryCountItemUpdateSerializer(ForeignKeyIdMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating InventoryCountItem instances (for counting).
+    Takes the counting user by id.
     """
+    counted_by = serializers.IntegerField(source='counted_by_id', required=False, allow_null=True)
+    
     class Meta:
         model = InventoryCountItem
-        fields = [
+        fields = (
             'counted_quantity', 'is_counted', 'counted_by', 'notes'
-        ]
+        )
+        list_serializer_class = InventoryCountItemBulkUpdateSerializer
         
     def validate(self, data):
         """
         Validate inventory count item data.
         """
-        is_counted = data.get('is_counted', self.instance.is_counted if self.instance else False)
-        counted_quantity = data.get('counted_quantity', self.instance.counted_quantity if self.instance else None)
-        counted_by = data.get('counted_by', self.instance.counted_by if self.instance else None)
+        # Items updated in bulk are validated by the list serializer, which
+        # knows the item each entry updates
+        if isinstance(self.parent, serializers.ListSerializer):
+            return data
+        return self.validate_counted(data, self.instance)
+    
+    def validate_counted(self, data, instance):
+        """
+        Check the data of a count item, falling back to the item's current values.
+        """
+        is_counted = data.get('is_counted', instance.is_counted if instance else False)
+        counted_quantity = data.get('counted_quantity', instance.counted_quantity if instance else None)
+        counted_by = data.get('counted_by_id', instance.counted_by_id if instance else None)
         
         # If is_counted is True, counted_quantity and counted_by must be provided
         if is_counted:
@@ -698,211 +1088,164 @@ class InventoryCountItemUpdateSerializer(serializers.ModelSerializer):
         """
         # If marking as counted, set the counted_at timestamp
         if validated_data.get('is_counted') and not instance.is_counted:
-            from django.utils import timezone
             validated_data['counted_at'] = timezone.now()
             
         return super().update(instance, validated_data) 
 
 # Order serializers
-class OrderItemSerializer(serializers.ModelSerializer):
+class OrderItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Base serializer for OrderItem instances.
-    Handles all order item operations with conditional field inclusion
-    based on context or action.
+    Serializer for OrderItem instances, nested in orders.
     """
     # Fields for list view
-    product_name = serializers.ReadOnlyField(source='product.name')
-    total_price = serializers.ReadOnlyField()
-    is_fully_received = serializers.ReadOnlyField()
-    receiving_status = serializers.ReadOnlyField()
+    product_name = FastReadOnlyField(source='product.name')
+    product_sku = FastReadOnlyField(source='product.sku')
+    total_price = FastReadOnlyField()
+    is_fully_received = FastReadOnlyField()
+    receiving_status = FastReadOnlyField()
+    product = FastReadOnlyField(source='product_id')
     
-    # Fields for detail view
-    product = serializers.SerializerMethodField()
+    # Write-only fields
+    product_id = serializers.IntegerField(write_only=True)
     
     class Meta:
         model = OrderItem
-        fields = [
-            'id', 'product', 'product_name', 'quantity', 'unit_price',
+        fields = (
+            'id', 'product', 'product_id', 'product_name', 'product_sku', 'quantity', 'unit_price',
             'received_quantity', 'notes', 'total_price', 'is_fully_received',
             'receiving_status', 'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['created_at', 'updated_at']
+        )
+        read_only_fields = ('created_at', 'updated_at')
     
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the serializer with dynamic field sets based on context.
+    @classmethod
+    def setup_eager_loading(cls, queryset):
         """
-        super().__init__(*args, **kwargs)
+        Load the product and compute the item totals read by the representation.
         
-        # Get the request context to determine which fields to include
-        request = self.context.get('request')
-        if not request:
-            return
-            
-        # For list action, exclude detailed fields
-        if self.context.get('view') and self.context['view'].action == 'list':
-            self.fields.pop('notes', None)
-            self.fields.pop('created_at', None)
-            self.fields.pop('updated_at', None)
-            
-        # For create/update actions, use simplified representation
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            self.fields.pop('product_name', None)
-            self.fields.pop('total_price', None)
-            self.fields.pop('is_fully_received', None)
-            self.fields.pop('receiving_status', None)
-    
-    def get_product(self, obj):
-        """Return the full ProductSerializer representation for detail view."""
-        if self.context.get('view') and self.context['view'].action in ['retrieve', 'detail']:
-            return ProductSerializer(obj.product).data
-        return obj.product_id
-    
-    def validate(self, data):
-        """
-        Validate that the order-product combination is unique.
+        total_price and is_fully_received are annotated so the database
+        computes them along with the rows.
         """
-        order = self.context.get('order')
-        product = data.get('product')
-        
-        if not order:
-            raise serializers.ValidationError(
-                {"order": "Order is required for creating/updating order items."}
+        return queryset.select_related('product').annotate(
+            total_price=F('quantity') * F('unit_price'),
+            is_fully_received=ExpressionWrapper(
+                Q(received_quantity__gte=F('quantity')), output_field=BooleanField()
             )
-        
-        # Check if we're creating a new object or updating an existing one
-        instance = self.instance
-        
-        # If instance is None, we're creating a new object
-        if instance is None:
-            if OrderItem.objects.filter(order=order, product=product).exists():
-                raise serializers.ValidationError(
-                    {"product": "This product is already in the order."}
-                )
-                
-        # If instance is not None, we're updating an existing object
-        else:
-            # If we're changing the product
-            if product != instance.product:
-                if OrderItem.objects.filter(order=order, product=product).exists():
-                    raise serializers.ValidationError(
-                        {"product": "This product is already in the order."}
-                    )
-                    
-        return data
+        )
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
-    Base serializer for Order instances.
-    Handles all order operations with conditional field inclusion
-    based on context or action.
+    Serializer for listing Order instances.
+    Refers to the supplier and users by id and name.
     """
-    # Fields for list view
-    supplier_name = serializers.ReadOnlyField(source='supplier.name')
-    status_display = serializers.ReadOnlyField(source='get_status_display')
-    created_by_username = serializers.ReadOnlyField(source='created_by.username')
-    updated_by_username = serializers.SerializerMethodField()
-    subtotal = serializers.ReadOnlyField()
-    total = serializers.ReadOnlyField()
-    item_count = serializers.SerializerMethodField()
-    
-    # Fields for detail view
-    supplier = serializers.SerializerMethodField()
-    created_by = serializers.SerializerMethodField()
-    updated_by = serializers.SerializerMethodField()
-    items = serializers.SerializerMethodField()
+    supplier = FastReadOnlyField(source='supplier_id')
+    supplier_name = FastReadOnlyField(source='supplier.name')
+    status_display = ChoiceDisplayField(source='status')
+    created_by = FastReadOnlyField(source='created_by_id')
+    created_by_username = FastReadOnlyField(source='created_by.username')
+    updated_by = FastReadOnlyField(source='updated_by_id')
+    updated_by_username = FastReadOnlyField(source='updated_by.username', default=None)
+    subtotal = FastReadOnlyField()
+    total = FastReadOnlyField()
+    item_count = serializers.IntegerField(read_only=True)
     
-    # Write-only fields
-    supplier_id = serializers.PrimaryKeyRelatedField(
-        source='supplier',
-        queryset=Supplier.objects.all(),
-        write_only=True
+    # Columns read by the list representation, as only() arguments
+    list_only_fields = (
+        'id', 'order_number', 'supplier__name', 'status', 'order_date',
+        'expected_delivery_date', 'actual_delivery_date', 'shipping_cost', 'tax',
+        'discount', 'created_by__username', 'updated_by__username',
+        'is_active', 'created_at', 'updated_at'
     )
-    items_data = OrderItemSerializer(many=True, required=False, write_only=True)
     
     class Meta:
         model = Order
-        fields = [
-            'id', 'order_number', 'supplier', 'supplier_id', 'supplier_name',
+        fields = (
+            'id', 'order_number', 'supplier', 'supplier_name',
+            'status', 'status_display', 'order_date', 'expected_delivery_date',
+            'actual_delivery_date',
+            'created_by', 'created_by_username', 'updated_by', 'updated_by_username',
+            'subtotal', 'total', 'item_count',
+            'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = fields
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load the related objects and items read by the representation.
+        
+        item_count is annotated so it comes with the orders in one query.
+        """
+        return queryset.select_related(
+            'supplier', 'created_by', 'updated_by'
+        ).prefetch_related(
+            Prefetch('items', queryset=OrderItemSerializer.setup_eager_loading(OrderItem.objects.all()))
+        ).annotate(item_count=Count('items'))
+
+
+class OrderDetailSerializer(OrderListSerializer):
+    """
+    Serializer for detailed Order information.
+    Nests the supplier, users and items.
+    """
+    supplier = SupplierSerializer(read_only=True)
+    created_by = UserMiniSerializer(read_only=True)
+    updated_by = UserMiniSerializer(read_only=True)
+    items = OrderItemSerializer(many=True, read_only=True)
+    
+    class Meta(OrderListSerializer.Meta):
+        fields = (
+            'id', 'order_number', 'supplier', 'supplier_name',
             'status', 'status_display', 'order_date', 'expected_delivery_date',
             'actual_delivery_date', 'shipping_cost', 'tax', 'discount', 'notes',
             'created_by', 'created_by_username', 'updated_by', 'updated_by_username',
-            'subtotal', 'total', 'item_count', 'items', 'items_data',
+            'subtotal', 'total', 'item_count', 'items',
             'is_active', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['order_number', 'created_at', 'updated_at']
+        )
+        read_only_fields = fields
+
+
+class OrderCreateUpdateSerializer(ForeignKeyIdMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Serializer for creating and updating Order instances.
+    Takes the supplier by id and the items as items_data.
+    """
+    supplier_id = serializers.IntegerField(
+        write_only=True
+    )
+    items_data = OrderItemSerializer(many=True, required=False, write_only=True)
+    
+    class Meta:
+        model = Order
+        fields = (
+            'id', 'order_number', 'supplier_id',
+            'status', 'order_date', 'expected_delivery_date',
+            'actual_delivery_date', 'shipping_cost', 'tax', 'discount', 'notes',
+            'items_data', 'is_active', 'created_at', 'updated_at'
+        )
+        read_only_fields = ('order_number', 'created_at', 'updated_at')
     
-    def __init__(self, *args, **kwargs):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Writes don't render related objects, so there is nothing to load.
         """
-        Initialize the serializer with dynamic field sets based on context.
+        return queryset
+    
+    def validate_items_data(self, items_data):
         """
-        super().__init__(*args, **kwargs)
+        Check that each product appears only once among the items.
         
-        # Get the request context to determine which fields to include
-        request = self.context.get('request')
-        if not request:
-            return
-            
-        # For list action, exclude detailed fields
-        if self.context.get('view') and self.context['view'].action == 'list':
-            self.fields.pop('notes', None)
-            self.fields.pop('shipping_cost', None)
-            self.fields.pop('tax', None)
-            self.fields.pop('discount', None)
-            self.fields.pop('items', None)
-            
-        # For create/update actions, use simplified representation
-        if request.method in ['POST', 'PUT', 'PATCH']:
-            self.fields.pop('supplier', None)
-            self.fields.pop('supplier_name', None)
-            self.fields.pop('status_display', None)
-            self.fields.pop('created_by', None)
-            self.fields.pop('created_by_username', None)
-            self.fields.pop('updated_by', None)
-            self.fields.pop('updated_by_username', None)
-            self.fields.pop('subtotal', None)
-            self.fields.pop('total', None)
-            self.fields.pop('item_count', None)
-            self.fields.pop('items', None)
-        else:  # For GET requests
-            self.fields.pop('supplier_id', None)
-            self.fields.pop('items_data', None)
-    
-    def get_supplier(self, obj):
-        """Return the full SupplierSerializer representation for detail view."""
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return SupplierSerializer(obj.supplier).data
-        return obj.supplier_id
-    
-    def get_created_by(self, obj):
-        """Return the full UserSerializer representation for created_by."""
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return UserSerializer(obj.created_by).data if obj.created_by else None
-        return obj.created_by_id if obj.created_by else None
-    
-    def get_updated_by(self, obj):
-        """Return the full UserSerializer representation for updated_by."""
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return UserSerializer(obj.updated_by).data if obj.updated_by else None
-        return obj.updated_by_id if obj.updated_by else None
-    
-    def get_updated_by_username(self, obj):
-        """Get the username of the user who updated this order."""
-        if obj.updated_by:
-            return obj.updated_by.username
-        return None
-    
-    def get_item_count(self, obj):
-        """Get the number of items in this order."""
-        return obj.items.count()
-    
-    def get_items(self, obj):
-        """Return OrderItemSerializer instances for all items in this order."""
-        # Only return items in detail view
-        if self.context.get('view') and self.context['view'].action == 'retrieve':
-            return OrderItemSerializer(obj.items.all(), many=True, context=self.context).data
-        return None
+        The items make up all of the order's items, on create and when they
+        replace the existing ones on update, so no stored item can clash.
+        """
+        counts = Counter(item['product_id'] for item in items_data)
+        duplicates = sorted(pk for pk, count in counts.items() if count > 1)
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Products {', '.join(map(str, duplicates))} are in the order more than once."
+            )
+        return items_data
     
     def validate(self, data):
         """
@@ -933,17 +1276,14 @@ class OrderSerializer(serializers.ModelSerializer):
         """
         items_data = validated_data.pop('items_data', [])
         
-        # Generate an order number if not provided
-        if not validated_data.get('order_number'):
-            import uuid
-            validated_data['order_number'] = f"ORD-{uuid.uuid4().hex[:8].upper()}"
-        
-        # Create the order
+        # Create the order; the model generates its order number
         order = Order.objects.create(**validated_data)
         
-        # Create order items
-        for item_data in items_data:
-            OrderItem.objects.create(order=order, **item_data)
+        # Create order items in one INSERT; OrderItem has no save() logic or signals
+        OrderItem.objects.bulk_create(
+            [OrderItem(order=order, **item_data) for item_data in items_data],
+            batch_size=500
+        )
             
         return order
     
@@ -964,17 +1304,10 @@ class OrderSerializer(serializers.ModelSerializer):
             # This is a simplified approach; in a real application,
             # you might want to handle updates to existing items and deletions
             instance.items.all().delete()
-            for item_data in items_data:
-                OrderItem.objects.create(order=instance, **item_data)
+            OrderItem.objects.bulk_create(
+                [OrderItem(order=instance, **item_data) for item_data in items_data],
+                batch_size=500
+            )
         
         return instance
 
-
-# Keeping these aliases for backward compatibility during transition
-OrderItemListSerializer = OrderItemSerializer
-OrderItemDetailSerializer = OrderItemSerializer
-OrderItemCreateUpdateSerializer = OrderItemSerializer
-OrderListSerializer = OrderSerializer
-OrderDetailSerializer = OrderSerializer
-OrderCreateSerializer = OrderSerializer
-OrderUpdateSerializer = OrderSerializer 
\ No newline at end of file
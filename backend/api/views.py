@@ -2,6 +2,7 @@
 API views for the CocktailAI project.
 """
 
+from functools import cache
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -16,23 +17,22 @@ from rest_framework import mixins
 from django.db.models import Sum
 
 # Import models and serializers
-from accounts.models import User, UserPreferences
+from accounts.models import User
 from inventory.models import (
     Category, Supplier, Location, Product, InventoryItem,
     InventoryTransaction, InventoryCount, InventoryCountItem,
     Order, OrderItem
 )
 from .serializers import (
-    UserSerializer, UserCreateSerializer, UserPreferencesSerializer,
+    UserSerializer, UserListSerializer, UserCreateSerializer, UserPreferencesSerializer,
     CategorySerializer, SupplierSerializer, LocationSerializer,
     ProductListSerializer, ProductDetailSerializer, ProductCreateUpdateSerializer,
     InventoryItemListSerializer, InventoryItemDetailSerializer, InventoryItemCreateUpdateSerializer,
     InventoryTransactionListSerializer, InventoryTransactionDetailSerializer, 
     InventoryTransactionCreateSerializer, InventoryCountListSerializer,
     InventoryCountDetailSerializer, InventoryCountCreateUpdateSerializer,
-    InventoryCountItemSerializer, InventoryCountItemUpdateSerializer,
-    OrderListSerializer, OrderDetailSerializer, OrderCreateSerializer, OrderUpdateSerializer,
-    OrderItemListSerializer, OrderItemDetailSerializer, OrderItemCreateUpdateSerializer
+    InventoryCountItemSerializer, InventoryCountItemUpdateSerializer, InventoryCountItemIdSerializer,
+    OrderListSerializer, OrderDetailSerializer, OrderCreateUpdateSerializer
 )
 # Import custom permissions
 from .permissions import (
@@ -57,7 +57,26 @@ from drf_spectacular.utils import (
     OpenApiParameter, OpenApiExample, 
     OpenApiResponse, inline_serializer
 )
-from .docs import API_FEATURES_DOCS, FILTERING_DOCS, SORTING_DOCS, PAGINATION_DOCS
+from .cache import CachedReadMixin
+from .export import ExportMixin
+from .docs import get_api_features_docs, get_filtering_docs, get_sorting_docs, get_pagination_docs
+
+
+@cache
+def preferences_only_fields():
+    """
+    Return the columns the preferences endpoints need, as only() arguments.
+    
+    Driven by UserPreferencesSerializer's declared fields; the ones sourced
+    from 'preferences.*' all live in the preferences JSON column.
+    date_updated is included so that saves still bump it. The fields are
+    fixed, so the set is built once.
+    """
+    fields = {'date_updated'}
+    for field in UserPreferencesSerializer().fields.values():
+        fields.add(field.source_attrs[0])
+    return frozenset(fields)
+
 
 class UserViewSet(viewsets.ModelViewSet):
     """
@@ -94,6 +113,8 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         if self.action == 'create':
             return UserCreateSerializer
+        if self.action == 'list':
+            return UserListSerializer
         return UserSerializer
     
     def get_permissions(self):
@@ -120,13 +141,20 @@ class UserViewSet(viewsets.ModelViewSet):
         Filter queryset based on the user's permissions.
         """
         user = self.request.user
+        queryset = User.objects.all()
+        
+        # The list serializer doesn't render these columns
+        if self.action == 'list':
+            queryset = queryset.defer('profile_image', 'bio')
+        elif self.action == 'preferences':
+            queryset = queryset.only(*preferences_only_fields())
         
         # Admin users can see all users
         if user.is_staff:
-            return User.objects.all()
+            return queryset
         
         # Non-admin users can only see their own profile
-        return User.objects.filter(id=user.id)
+        return queryset.filter(id=user.id)
     
     @action(detail=True, methods=['get', 'put', 'patch'], url_path='preferences')
     def preferences(self, request, pk=None):
@@ -141,15 +169,12 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         user = self.get_object()
         
-        # Create preferences if they don't exist
-        preferences, created = UserPreferences.objects.get_or_create(user=user)
-        
         if request.method == 'GET':
-            serializer = UserPreferencesSerializer(preferences)
+            serializer = UserPreferencesSerializer(user)
             return Response(serializer.data)
         
         # Update preferences
-        serializer = UserPreferencesSerializer(preferences, data=request.data, partial=request.method == 'PATCH')
+        serializer = UserPreferencesSerializer(user, data=request.data, partial=request.method == 'PATCH')
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data)
@@ -168,7 +193,7 @@ class UserViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
             
-        queryset = UserPreferences.objects.all()
+        queryset = User.objects.only(*preferences_only_fields())
         
         # Apply filtering
         filter_backends = [DjangoFilterBackend]
@@ -216,7 +241,7 @@ class UserViewSet(viewsets.ModelViewSet):
         tags=["Categories"]
     ),
 )
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(CachedReadMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing product categories.
     
@@ -224,6 +249,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
     """
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_resource = 'categories'
     permission_classes = [IsStaffOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = CategoryFilter
@@ -245,7 +271,9 @@ class CategoryViewSet(viewsets.ModelViewSet):
         Returns a paginated list of products that belong to the specified category.
         """
         category = self.get_object()
-        products = Product.objects.filter(category=category)
+        products = ProductListSerializer.values_rows(
+            ProductListSerializer.setup_eager_loading(Product.objects.filter(category=category))
+        )
         
         return paginate_queryset(self, products, ProductListSerializer)
 
@@ -282,7 +310,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
         tags=["Suppliers"]
     ),
 )
-class SupplierViewSet(viewsets.ModelViewSet):
+class SupplierViewSet(CachedReadMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing suppliers.
     
@@ -290,6 +318,7 @@ class SupplierViewSet(viewsets.ModelViewSet):
     """
     queryset = Supplier.objects.all()
     serializer_class = SupplierSerializer
+    cache_resource = 'suppliers'
     permission_classes = [IsStaffOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = SupplierFilter
@@ -311,7 +340,9 @@ class SupplierViewSet(viewsets.ModelViewSet):
         Returns a paginated list of products that are provided by the specified supplier.
         """
         supplier = self.get_object()
-        products = Product.objects.filter(supplier=supplier)
+        products = ProductListSerializer.values_rows(
+            ProductListSerializer.setup_eager_loading(Product.objects.filter(supplier=supplier))
+        )
         
         return paginate_queryset(self, products, ProductListSerializer)
 
@@ -329,9 +360,11 @@ class SupplierViewSet(viewsets.ModelViewSet):
         Returns a paginated list of orders placed with the specified supplier.
         """
         supplier = self.get_object()
-        orders = Order.objects.filter(supplier=supplier)
+        orders = OrderListSerializer.setup_eager_loading(
+            Order.objects.filter(supplier=supplier)
+        ).only(*OrderListSerializer.list_only_fields)
         
-        return paginate_queryset(self, orders, OrderSerializer)
+        return paginate_queryset(self, orders, OrderListSerializer)
 
 
 @extend_schema_view(
@@ -366,7 +399,7 @@ class SupplierViewSet(viewsets.ModelViewSet):
         tags=["Locations"]
     ),
 )
-class LocationViewSet(viewsets.ModelViewSet):
+class LocationViewSet(CachedReadMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing inventory locations.
     
@@ -375,6 +408,7 @@ class LocationViewSet(viewsets.ModelViewSet):
     """
     queryset = Location.objects.all()
     serializer_class = LocationSerializer
+    cache_resource = 'locations'
     permission_classes = [IsStaffOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = LocationFilter
@@ -396,9 +430,11 @@ class LocationViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory items stored at the specified location.
         """
         location = self.get_object()
-        items = InventoryItem.objects.filter(location=location)
+        items = InventoryItemListSerializer.values_rows(
+            InventoryItemListSerializer.setup_eager_loading(InventoryItem.objects.filter(location=location))
+        )
         
-        return paginate_queryset(self, items, InventoryItemSerializer)
+        return paginate_queryset(self, items, InventoryItemListSerializer)
 
     @extend_schema_with_auth(
         summary="Get inventory counts for a location",
@@ -414,9 +450,11 @@ class LocationViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory count sessions for the specified location.
         """
         location = self.get_object()
-        counts = InventoryCount.objects.filter(location=location)
+        counts = InventoryCountListSerializer.values_rows(
+            InventoryCountListSerializer.setup_eager_loading(InventoryCount.objects.filter(location=location))
+        )
         
-        return paginate_queryset(self, counts, InventoryCountSerializer)
+        return paginate_queryset(self, counts, InventoryCountListSerializer)
 
     @extend_schema_with_auth(
         summary="Get transactions at a location",
@@ -432,11 +470,11 @@ class LocationViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory transactions that occurred at the specified location.
         """
         location = self.get_object()
-        transactions = InventoryTransaction.objects.filter(
-            inventory_item__location=location
+        transactions = InventoryTransactionListSerializer.values_rows(
+            InventoryTransactionListSerializer.setup_eager_loading(InventoryTransaction.objects.filter(location=location))
         ).order_by('-created_at')
         
-        return paginate_queryset(self, transactions, InventoryTransactionSerializer)
+        return paginate_queryset(self, transactions, InventoryTransactionListSerializer)
 
 
 @extend_schema_view(
@@ -521,7 +559,7 @@ class UserViewSet(viewsets.ModelViewSet):
         tags=["Inventory"]
     ),
 )
-class InventoryItemViewSet(viewsets.ModelViewSet):
+class InventoryItemViewSet(ExportMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing inventory items.
     
@@ -533,7 +571,23 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
     filterset_class = InventoryItemFilter
     search_fields = ['product__name', 'location__name']
     ordering_fields = ['product__name', 'location__name', 'quantity', 'created_at', 'updated_at']
-    serializer_class = InventoryItemSerializer
+    
+    def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.setup_eager_loading(super().get_queryset())
+        if self.action in ['list', 'export']:
+            queryset = serializer_class.values_rows(queryset)
+        return queryset
+    
+    def get_serializer_class(self):
+        """
+        Return the appropriate serializer based on the action.
+        """
+        if self.action == 'retrieve':
+            return InventoryItemDetailSerializer
+        elif self.action in ['create', 'update', 'partial_update']:
+            return InventoryItemCreateUpdateSerializer
+        return InventoryItemListSerializer
 
     @extend_schema_with_auth(
         summary="Get transactions for an inventory item",
@@ -549,9 +603,16 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory transactions for the specified inventory item.
         """
         inventory_item = self.get_object()
-        transactions = inventory_item.transactions.all().order_by('-created_at')
+        transactions = InventoryTransactionListSerializer.values_rows(
+            InventoryTransactionListSerializer.setup_eager_loading(
+                InventoryTransaction.objects.filter(
+                    product_id=inventory_item.product_id,
+                    location_id=inventory_item.location_id
+                )
+            )
+        ).order_by('-created_at')
         
-        return paginate_queryset(self, transactions, InventoryTransactionSerializer)
+        return paginate_queryset(self, transactions, InventoryTransactionListSerializer)
 
 @extend_schema_view(
     list=extend_schema_with_auth(
@@ -586,7 +647,7 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
         tags=["Transactions"]
     ),
 )
-class InventoryTransactionViewSet(viewsets.ModelViewSet):
+class InventoryTransactionViewSet(ExportMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing inventory transactions.
     
@@ -597,10 +658,26 @@ class InventoryTransactionViewSet(viewsets.ModelViewSet):
     permission_classes = [IsOwnerOrStaffOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = InventoryTransactionFilter
-    search_fields = ['inventory_item__product__name', 'notes']
+    search_fields = ['product__name', 'notes']
     ordering_fields = ['created_at', 'quantity', 'transaction_type']
     ordering = ['-created_at']
-    serializer_class = InventoryTransactionSerializer
+    
+    def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.setup_eager_loading(super().get_queryset())
+        if self.action in ['list', 'export']:
+            queryset = serializer_class.values_rows(queryset)
+        return queryset
+    
+    def get_serializer_class(self):
+        """
+        Return the appropriate serializer based on the action.
+        """
+        if self.action == 'retrieve':
+            return InventoryTransactionDetailSerializer
+        elif self.action in ['create', 'update', 'partial_update']:
+            return InventoryTransactionCreateSerializer
+        return InventoryTransactionListSerializer
     
     def perform_create(self, serializer):
         serializer.save(performed_by=self.request.user)
@@ -653,13 +730,25 @@ class InventoryCountViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'count_date', 'status']
     ordering = ['-created_at']
     
+    def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.setup_eager_loading(super().get_queryset())
+        if self.action == 'list':
+            queryset = serializer_class.values_rows(queryset)
+        return queryset
+    
     def get_serializer_class(self):
+        """
+        Return the appropriate serializer based on the action.
+        """
         if self.action == 'retrieve':
             return InventoryCountDetailSerializer
-        return InventoryCountSerializer
+        elif self.action in ['create', 'update', 'partial_update']:
+            return InventoryCountCreateUpdateSerializer
+        return InventoryCountListSerializer
     
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user)
+        serializer.save(created_by_id=self.request.user.id)
 
     @extend_schema_with_auth(
         summary="Get uncounted items for an inventory count",
@@ -674,10 +763,42 @@ class InventoryCountViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory count items that haven't been marked as counted.
         """
         inventory_count = self.get_object()
-        uncounted_items = inventory_count.count_items.filter(is_counted=False)
+        uncounted_items = InventoryCountItemSerializer.setup_eager_loading(
+            inventory_count.count_items.filter(is_counted=False)
+        )
         
         return paginate_queryset(self, uncounted_items, InventoryCountItemSerializer)
 
+    @extend_schema_with_auth(
+        summary="Update items of an inventory count",
+        description="Updates several items of this count session at once. Takes a list of objects with each item's id and the fields to change.",
+        tags=["Inventory Counts"]
+    )
+    @action(detail=True, methods=['patch'], url_path='count-items')
+    def count_items(self, request, pk=None):
+        """
+        Record counts for several items of this count session.
+        
+        All submitted items are validated first and then saved with a single query.
+        """
+        inventory_count = self.get_object()
+        if not isinstance(request.data, list) or not all(isinstance(entry, dict) for entry in request.data):
+            return create_error_response("Expected a list of count items.")
+        
+        id_serializer = InventoryCountItemIdSerializer(data=request.data, many=True)
+        id_serializer.is_valid(raise_exception=True)
+        ids = [entry['id'] for entry in id_serializer.validated_data]
+        items = InventoryCountItemSerializer.setup_eager_loading(inventory_count.count_items.all()).in_bulk(ids)
+        if len(items) != len(ids) or len(set(ids)) != len(ids):
+            return create_error_response("Each entry needs the id of a different item of this count.")
+        
+        serializer = InventoryCountItemUpdateSerializer(
+            [items[pk] for pk in ids], data=request.data, many=True, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(InventoryCountItemSerializer(serializer.instance, many=True).data)
+
 @extend_schema_view(
     list=extend_schema_with_auth(
         summary="List all orders",
@@ -724,7 +845,23 @@ class OrderViewSet(viewsets.ModelViewSet):
     search_fields = ['supplier__name', 'notes', 'reference_number']
     ordering_fields = ['created_at', 'order_date', 'status', 'total_cost']
     ordering = ['-created_at']
-    serializer_class = OrderSerializer
+    
+    def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.setup_eager_loading(super().get_queryset())
+        if self.action == 'list':
+            queryset = queryset.only(*serializer_class.list_only_fields)
+        return queryset
+    
+    def get_serializer_class(self):
+        """
+        Return the appropriate serializer based on the action.
+        """
+        if self.action in ['retrieve', 'place', 'receive']:
+            return OrderDetailSerializer
+        elif self.action in ['create', 'update', 'partial_update']:
+            return OrderCreateUpdateSerializer
+        return OrderListSerializer
     
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -753,7 +890,7 @@ class OrderViewSet(viewsets.ModelViewSet):
         order.order_date = timezone.now().date()
         order.save()
         
-        return Response(OrderSerializer(order).data)
+        return Response(self.get_serializer(order).data)
 
     @extend_schema_with_auth(
         summary="Mark order as received",
@@ -802,7 +939,7 @@ class OrderViewSet(viewsets.ModelViewSet):
             order.received_date = timezone.now().date()
             order.save()
         
-        return Response(OrderSerializer(order).data)
+        return Response(self.get_serializer(order).data)
 
 # Viewset classes will be added here as models and serializers are created
 # Example:
@@ -851,20 +988,28 @@ class OrderViewSet(viewsets.ModelViewSet):
         tags=["Products"]
     ),
 )
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(CachedReadMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing products.
     
     Products represent items that can be stocked in the inventory.
     """
     queryset = Product.objects.all()
+    cache_resource = 'products'
     permission_classes = [IsStaffOrReadOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    # ProductFilter handles ?search= with the full-text and trigram indexes
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ProductFilter
-    search_fields = ['name', 'sku', 'description', 'barcode', 'category__name', 'supplier__name']
     ordering_fields = ['name', 'category__name', 'supplier__name', 'unit_price', 'created_at', 'updated_at']
     ordering = ['name']
     
+    def get_queryset(self):
+        serializer_class = self.get_serializer_class()
+        queryset = serializer_class.setup_eager_loading(super().get_queryset())
+        if self.action == 'list':
+            queryset = serializer_class.values_rows(queryset)
+        return queryset
+    
     def get_serializer_class(self):
         """
         Return the appropriate serializer based on the action.
@@ -889,9 +1034,11 @@ class ProductViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory items for the specified product across all locations.
         """
         product = self.get_object()
-        items = InventoryItem.objects.filter(product=product)
+        items = InventoryItemListSerializer.values_rows(
+            InventoryItemListSerializer.setup_eager_loading(InventoryItem.objects.filter(product=product))
+        )
         
-        return paginate_queryset(self, items, InventoryItemSerializer)
+        return paginate_queryset(self, items, InventoryItemListSerializer)
 
     @extend_schema_with_auth(
         summary="Get transactions for a product",
@@ -907,11 +1054,11 @@ class ProductViewSet(viewsets.ModelViewSet):
         Returns a paginated list of inventory transactions for the specified product.
         """
         product = self.get_object()
-        transactions = InventoryTransaction.objects.filter(
-            inventory_item__product=product
+        transactions = InventoryTransactionListSerializer.values_rows(
+            InventoryTransactionListSerializer.setup_eager_loading(InventoryTransaction.objects.filter(product=product))
         ).order_by('-created_at')
         
-        return paginate_queryset(self, transactions, InventoryTransactionSerializer)
+        return paginate_queryset(self, transactions, InventoryTransactionListSerializer)
 
 class APIDocs(viewsets.ViewSet):
     """
@@ -929,7 +1076,7 @@ class APIDocs(viewsets.ViewSet):
         """
         Documentation for all API features, including filtering, sorting, and pagination.
         """
-        return Response({"documentation": API_FEATURES_DOCS})
+        return Response({"documentation": get_api_features_docs()})
     
     @extend_schema(
         summary="API Filtering Documentation",
@@ -941,7 +1088,7 @@ class APIDocs(viewsets.ViewSet):
         """
         Documentation for API filtering capabilities.
         """
-        return Response({"documentation": FILTERING_DOCS})
+        return Response({"documentation": get_filtering_docs()})
     
     @extend_schema(
         summary="API Sorting Documentation",
@@ -953,7 +1100,7 @@ class APIDocs(viewsets.ViewSet):
         """
         Documentation for API sorting capabilities.
         """
-        return Response({"documentation": SORTING_DOCS})
+        return Response({"documentation": get_sorting_docs()})
     
     @extend_schema(
         summary="API Pagination Documentation",
@@ -965,4 +1112,4 @@ class APIDocs(viewsets.ViewSet):
         """
         Documentation for API pagination capabilities.
         """
-        return Response({"documentation": PAGINATION_DOCS}) 
\ No newline at end of file
+        return Response({"documentation": get_pagination_docs()}) 
\ No newline at end of file
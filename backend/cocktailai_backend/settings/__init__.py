@@ -8,4 +8,6 @@ env = config('DJANGO_SETTINGS_MODULE', default='cocktailai_backend.settings.dev'
 if env == 'cocktailai_backend.settings.dev':
     from .dev import *
 elif env == 'cocktailai_backend.settings.prod':
-    from .prod import * 
\ No newline at end of file
+    from .prod import *
+elif env == 'cocktailai_backend.settings.test':
+    from .test import *
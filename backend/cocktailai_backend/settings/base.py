@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third-party apps
     'rest_framework',
@@ -143,6 +144,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.OrjsonRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
@@ -181,6 +186,14 @@ CELERY_TIMEZONE = TIME_ZONE
 EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@cocktailai.example.com')
 
+# Pre-generated OpenAPI schema served at /api/schema/ when set
+# (python manage.py spectacular --file schema.yaml)
+API_SCHEMA_FILE = config('API_SCHEMA_FILE', default='')
+
+# Seconds the data of cached category, supplier, location and product
+# responses is kept; writes to those models drop it earlier
+API_CACHE_TIMEOUT = config('API_CACHE_TIMEOUT', default=300, cast=int)
+
 # DRF Spectacular settings
 SPECTACULAR_SETTINGS = {
     'TITLE': 'CocktailAI API',
@@ -2,6 +2,8 @@
 Development settings for the CocktailAI project.
 """
 
+import logging
+
 from .base import *
 
 # SECURITY WARNING: keep the secret key used in production secret!
@@ -30,4 +32,13 @@ try:
     MIDDLEWARE.insert(0, 'debug_toolbar.middleware.DebugToolbarMiddleware')
     INTERNAL_IPS = ['127.0.0.1']
 except ImportError:
-    pass 
\ No newline at end of file
+    pass
+
+# Log lazy loads of related objects (n+1 queries)
+try:
+    import nplusone
+    INSTALLED_APPS.append('nplusone.ext.django')
+    MIDDLEWARE.insert(0, 'nplusone.ext.django.NPlusOneMiddleware')
+    NPLUSONE_LOG_LEVEL = logging.WARN
+except ImportError:
+    pass
@@ -0,0 +1,30 @@
+"""
+S3 storage backends for the CocktailAI project.
+
+Referenced from the production settings when USE_S3 is enabled.
+"""
+
+from django.conf import settings
+from storages.backends.s3boto3 import S3Boto3Storage
+
+
+class StaticStorage(S3Boto3Storage):
+    """Storage for collected static files."""
+    
+    location = settings.STATIC_LOCATION
+    default_acl = 'public-read'
+
+
+class MediaStorage(S3Boto3Storage):
+    """
+    Storage for uploaded media such as user profile images.
+    
+    Media objects are public-read and served from AWS_S3_CUSTOM_DOMAIN, so
+    URLs are built by plain string joins. Query string auth is turned off
+    explicitly so serializing a page of users never presigns one URL per row.
+    """
+    
+    location = settings.MEDIA_LOCATION
+    default_acl = 'public-read'
+    file_overwrite = False
+    querystring_auth = False
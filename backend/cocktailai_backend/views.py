@@ -0,0 +1,49 @@
+"""
+Project-level views for the CocktailAI project.
+"""
+
+import os
+
+from django.conf import settings
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from drf_spectacular.views import SpectacularAPIView
+
+
+class StaticSchemaView(SpectacularAPIView):
+    """
+    Serve the OpenAPI schema from the file generated at build time.
+    
+    The file is written with `python manage.py spectacular --file ...` and
+    located through settings.API_SCHEMA_FILE. Without it, when a format
+    other than YAML is requested, or when ?lang= or ?version= asks for a
+    variant the file doesn't hold, the schema is generated as usual.
+    """
+    
+    def get(self, request, *args, **kwargs):
+        schema_file = settings.API_SCHEMA_FILE
+        if (
+            not schema_file
+            or request.accepted_renderer.format != 'yaml'
+            or 'lang' in request.query_params
+            or 'version' in request.query_params
+        ):
+            return super().get(request, *args, **kwargs)
+        
+        try:
+            stat = os.stat(schema_file)
+        except FileNotFoundError:
+            return super().get(request, *args, **kwargs)
+        
+        # The file only changes on deploy, so clients can revalidate cheaply
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+        if response is None:
+            response = FileResponse(
+                open(schema_file, 'rb'),
+                content_type=request.accepted_renderer.media_type,
+            )
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        return response
@@ -64,6 +64,10 @@ class Command(BaseCommand):
                 # Since we're in a transaction, this will roll back all changes
                 raise
         
+        # loaddata skips the save handlers that keep these current
+        call_command('update_search_documents')
+        call_command('recount')
+        
         elapsed_time = time.time() - start_time
         self.stdout.write(self.style.SUCCESS(
             f'Successfully loaded {loaded_fixtures}/{total_fixtures} fixtures in {elapsed_time:.2f} seconds'
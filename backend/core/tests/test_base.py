@@ -5,6 +5,7 @@ These classes provide common functionality for other test cases to inherit.
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APITestCase, APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
@@ -79,6 +80,8 @@ class BaseAPITestCase(APITestCase):
     def setUp(self):
         """Set up for each test method."""
         self.client = APIClient()
+        # Cached responses outlive the rolled back data of earlier tests
+        cache.clear()
     
     def authenticate_as_admin(self):
         """Authenticate as admin user."""
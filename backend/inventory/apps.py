@@ -3,6 +3,7 @@ Inventory app configuration.
 """
 
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
 
 
 class InventoryConfig(AppConfig):
@@ -13,4 +14,5 @@ class InventoryConfig(AppConfig):
     
     def ready(self):
         """Import signals when the app is ready."""
-        import inventory.signals  # noqa 
\ No newline at end of file
+        import inventory.signals  # noqa
+        pre_migrate.connect(inventory.signals.create_trigram_extension, sender=self) 
\ No newline at end of file
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from inventory.models import Product
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search documents of all products'
+
+    def handle(self, *args, **options):
+        # Product saves and category/supplier renames keep the documents
+        # current; this fills them in for rows written before that, or
+        # through bulk paths that skip the signals
+        updated = Product.objects.update(search_document=Product.search_vector())
+        self.stdout.write(self.style.SUCCESS(f'Updated the search documents of {updated} products'))
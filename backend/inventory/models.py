@@ -3,8 +3,11 @@ Models for the inventory app.
 """
 
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from .validators import no_future_date_validator, date_not_before_validator, date_before_today_validator
 import uuid
@@ -26,6 +29,21 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class DatabaseValuesMixin:
+    """
+    Keep the column values last read from the database in _db_values.
+    
+    Save handlers compare against them to see what changed without reading
+    the row again. Only the loaded columns are present.
+    """
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._db_values = dict(zip(field_names, values))
+        return instance
+
+
 class Category(BaseModel):
     """
     Product category model.
@@ -36,6 +54,9 @@ class Category(BaseModel):
     name = models.CharField(_("Name"), max_length=100, unique=True)
     description = models.TextField(_("Description"), blank=True)
     
+    # Denormalized counter, kept up to date by the inventory signal handlers
+    product_count = models.PositiveIntegerField(_("Product Count"), default=0, editable=False, db_index=True)
+    
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
@@ -84,6 +105,9 @@ class Supplier(BaseModel):
     website = models.URLField(_("Website"), blank=True)
     notes = models.TextField(_("Notes"), blank=True)
     
+    # Denormalized counter, kept up to date by the inventory signal handlers
+    product_count = models.PositiveIntegerField(_("Product Count"), default=0, editable=False, db_index=True)
+    
     class Meta:
         verbose_name = _("Supplier")
         verbose_name_plural = _("Suppliers")
@@ -106,6 +130,9 @@ class Location(BaseModel):
     is_storage = models.BooleanField(_("Is Storage Location"), default=False)
     is_service = models.BooleanField(_("Is Service Location"), default=False)
     
+    # Denormalized counter, kept up to date by the inventory signal handlers
+    inventory_item_count = models.PositiveIntegerField(_("Inventory Item Count"), default=0, editable=False, db_index=True)
+    
     class Meta:
         verbose_name = _("Location")
         verbose_name_plural = _("Locations")
@@ -116,7 +143,7 @@ class Location(BaseModel):
         return self.name
 
 
-class Product(BaseModel):
+class Product(DatabaseValuesMixin, BaseModel):
     """
     Product model for inventory items.
     
@@ -164,6 +191,8 @@ class Product(BaseModel):
         ("volume", _("Volume")),
     ]
     
+    SEARCH_CONFIG = "english"
+    
     # Basic information
     name = models.CharField(_("Name"), max_length=255)
     sku = models.CharField(_("SKU"), max_length=50, blank=True)
@@ -237,20 +266,64 @@ class Product(BaseModel):
     # Additional information
     notes = models.TextField(_("Notes"), blank=True)
     
+    # Full-text search, kept up to date by the inventory signal handlers
+    search_document = SearchVectorField(_("Search Document"), null=True, editable=False)
+    
     class Meta:
         verbose_name = _("Product")
         verbose_name_plural = _("Products")
         ordering = ["name"]
         unique_together = [["supplier", "sku"]]
+        indexes = [
+            # Back the price range filters, alone and within a category
+            models.Index(fields=["unit_price"], name="product_unit_price_idx"),
+            models.Index(fields=["category", "unit_price"], name="product_category_price_idx"),
+            # Backs the substring (ILIKE) search on these columns
+            GinIndex(
+                name="product_trgm_idx",
+                fields=["name", "sku", "barcode", "description"],
+                opclasses=["gin_trgm_ops"] * 4,
+            ),
+            # Backs the full-text product search
+            GinIndex(fields=["search_document"], name="product_search_idx"),
+        ]
     
     def __str__(self):
         """Return the product name."""
         return self.name
     
+    @classmethod
+    def search_vector(cls):
+        """
+        Build the expression stored in search_document.
+        
+        Covers the product's own text fields and its category and supplier
+        names; the names are read through subqueries so that the expression
+        can be used in an UPDATE.
+        """
+        return SearchVector(
+            "name", "sku", "barcode", "description",
+            models.Subquery(Category.objects.filter(pk=models.OuterRef("category_id")).values("name")),
+            models.Subquery(Supplier.objects.filter(pk=models.OuterRef("supplier_id")).values("name")),
+            config=cls.SEARCH_CONFIG,
+        )
+    
     @property
     def total_quantity(self):
-        """Calculate total quantity across all locations."""
-        return sum(item.quantity for item in self.inventory_items.all())
+        """
+        Calculate total quantity across all locations.
+        
+        Querysets may annotate the sum as total_quantity, in which case it is
+        used as is instead of summing the inventory items.
+        """
+        try:
+            return self._total_quantity
+        except AttributeError:
+            return sum(item.quantity for item in self.inventory_items.all())
+    
+    @total_quantity.setter
+    def total_quantity(self, value):
+        self._total_quantity = value
     
     @property
     def total_value(self):
@@ -268,7 +341,7 @@ class Product(BaseModel):
         return self.total_quantity <= self.reorder_point
 
 
-class InventoryItem(BaseModel):
+class InventoryItem(DatabaseValuesMixin, BaseModel):
     """
     InventoryItem model to track product quantities at specific locations.
     """
@@ -296,7 +369,9 @@ class InventoryItem(BaseModel):
     class Meta:
         verbose_name = _("Inventory Item")
         verbose_name_plural = _("Inventory Items")
-        unique_together = [["product", "location"]]
+        constraints = [
+            models.UniqueConstraint(fields=["product", "location"], name="uniq_item_prod_loc"),
+        ]
     
     def __str__(self):
         """Return product and location information."""
@@ -413,6 +488,18 @@ class InventoryTransaction(BaseModel):
         verbose_name = _("Inventory Transaction")
         verbose_name_plural = _("Inventory Transactions")
         ordering = ["-created_at"]
+        indexes = [
+            # Back the default ordering, the created_* filters and per-product history
+            models.Index(fields=["-created_at"], name="invtxn_created_idx"),
+            models.Index(fields=["product", "-created_at"], name="invtxn_product_created_idx"),
+            models.Index(fields=["transaction_type"], name="invtxn_type_idx"),
+            # Backs the substring (ILIKE) search on these columns
+            GinIndex(
+                name="invtxn_trgm_idx",
+                fields=["reference", "notes"],
+                opclasses=["gin_trgm_ops"] * 2,
+            ),
+        ]
     
     def __str__(self):
         """Return transaction information."""
@@ -427,7 +514,6 @@ class InventoryTransaction(BaseModel):
         """
         Validate transaction data based on type.
         """
-        from django.core.exceptions import ValidationError
         
         # Ensure destination_location is set for transfers
         if self.transaction_type == "transferred" and not self.destination_location:
@@ -504,6 +590,18 @@ class InventoryCount(BaseModel):
         verbose_name = _("Inventory Count")
         verbose_name_plural = _("Inventory Counts")
         ordering = ["-created_at"]
+        indexes = [
+            # Back the default ordering and the created_*/scheduled_* filters
+            models.Index(fields=["-created_at"], name="invcount_created_idx"),
+            models.Index(fields=["scheduled_date"], name="invcount_scheduled_idx"),
+            models.Index(fields=["status"], name="invcount_status_idx"),
+            # Backs the substring (ILIKE) search on these columns
+            GinIndex(
+                name="invcount_trgm_idx",
+                fields=["name", "description", "notes"],
+                opclasses=["gin_trgm_ops"] * 3,
+            ),
+        ]
     
     def __str__(self):
         """Return count information."""
@@ -511,13 +609,37 @@ class InventoryCount(BaseModel):
     
     @property
     def total_items(self):
-        """Get the total number of items in this count."""
-        return self.count_items.count()
+        """
+        Get the total number of items in this count.
+        
+        Querysets may annotate the number as total_items, in which case it is
+        used as is instead of counting the items.
+        """
+        try:
+            return self._total_items
+        except AttributeError:
+            return self.count_items.count()
+    
+    @total_items.setter
+    def total_items(self, value):
+        self._total_items = value
     
     @property
     def completed_items(self):
-        """Get the number of completed items in this count."""
-        return self.count_items.filter(is_counted=True).count()
+        """
+        Get the number of completed items in this count.
+        
+        Querysets may annotate the number as completed_items, in which case it
+        is used as is instead of counting the items.
+        """
+        try:
+            return self._completed_items
+        except AttributeError:
+            return self.count_items.filter(is_counted=True).count()
+    
+    @completed_items.setter
+    def completed_items(self, value):
+        self._completed_items = value
     
     @property
     def progress_percentage(self):
@@ -530,7 +652,6 @@ class InventoryCount(BaseModel):
         """
         Validate inventory count data.
         """
-        from django.core.exceptions import ValidationError
         
         # If completed_date is provided, ensure it's not in the future
         if self.completed_date:
@@ -622,6 +743,12 @@ class InventoryCountItem(BaseModel):
         return None
 
 
+
+def generate_order_number():
+    """Return a new order number such as ORD-1A2B3C4D."""
+    return f"ORD-{uuid.uuid4().hex[:8].upper()}"
+
+
 class Order(BaseModel):
     """
     Order model for purchase orders to suppliers.
@@ -630,7 +757,7 @@ class Order(BaseModel):
     It includes order status, dates, financial information, and related order details.
     
     Fields:
-        order_number (CharField): Unique identifier for the order (max length: 50 chars).
+        order_number (CharField): Unique identifier for the order (max length: 50 chars), generated if not given.
         supplier (ForeignKey): Reference to the supplier this order is placed with.
         status (CharField): Current status of the order (draft, pending, placed, received, cancelled).
         order_date (DateField): Date when the order was placed (optional, cannot be in the future).
@@ -669,7 +796,9 @@ class Order(BaseModel):
         ("cancelled", _("Cancelled")),
     ]
     
-    order_number = models.CharField(_("Order Number"), max_length=50, unique=True)
+    order_number = models.CharField(
+        _("Order Number"), max_length=50, unique=True, default=generate_order_number
+    )
     supplier = models.ForeignKey(
         Supplier,
         on_delete=models.PROTECT,
@@ -736,6 +865,14 @@ class Order(BaseModel):
         verbose_name = _("Order")
         verbose_name_plural = _("Orders")
         ordering = ["-created_at"]
+        indexes = [
+            # Back the default ordering and the created_*/order_date_* filters,
+            # including the common supplier + status + date combination
+            models.Index(fields=["-created_at"], name="order_created_idx"),
+            models.Index(fields=["order_date"], name="order_date_idx"),
+            models.Index(fields=["supplier", "status", "order_date"], name="order_supplier_status_idx"),
+            models.Index(fields=["status"], name="order_status_idx"),
+        ]
     
     def __str__(self):
         """Return order information."""
@@ -755,7 +892,6 @@ class Order(BaseModel):
         """
         Validate order data based on status and dates.
         """
-        from django.core.exceptions import ValidationError
         
         # If status is 'placed', order_date is required and should not be in the future
         if self.status == 'placed' and not self.order_date:
@@ -844,13 +980,35 @@ class OrderItem(BaseModel):
     
     @property
     def total_price(self):
-        """Calculate the total price for this item."""
-        return self.quantity * self.unit_price
+        """
+        Calculate the total price for this item.
+        
+        Querysets may annotate it as total_price, in which case it is used as is.
+        """
+        try:
+            return self._total_price
+        except AttributeError:
+            return self.quantity * self.unit_price
+    
+    @total_price.setter
+    def total_price(self, value):
+        self._total_price = value
     
     @property
     def is_fully_received(self):
-        """Check if the item has been fully received."""
-        return self.received_quantity >= self.quantity
+        """
+        Check if the item has been fully received.
+        
+        Querysets may annotate it as is_fully_received, in which case it is used as is.
+        """
+        try:
+            return self._is_fully_received
+        except AttributeError:
+            return self.received_quantity >= self.quantity
+    
+    @is_fully_received.setter
+    def is_fully_received(self, value):
+        self._is_fully_received = value
     
     @property
     def receiving_status(self):
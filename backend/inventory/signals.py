@@ -2,13 +2,14 @@
 Signal handlers for the inventory app.
 """
 
-from django.db.models.signals import post_save, pre_save
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
-from django.db import transaction
+from django.db import connections, transaction
 
 from .models import (
-    InventoryTransaction, InventoryItem, Product, 
+    InventoryTransaction, InventoryItem, Product, Category, Supplier, Location,
     InventoryCount, InventoryCountItem, Order, OrderItem
 )
 
@@ -31,17 +32,17 @@ def update_inventory_on_transaction(sender, instance, created, **kwargs):
         with transaction.atomic():
             # Get or create inventory item for the primary location
             inventory_item, _ = InventoryItem.objects.get_or_create(
-                product=instance.product,
-                location=instance.location,
+                product_id=instance.product_id,
+                location_id=instance.location_id,
                 defaults={'quantity': 0}
             )
             
             # Handle transfer logic with destination location
-            if instance.transaction_type == "transferred" and instance.destination_location:
+            if instance.transaction_type == "transferred" and instance.destination_location_id:
                 # Get or create inventory item for the destination location
                 destination_item, _ = InventoryItem.objects.get_or_create(
-                    product=instance.product,
-                    location=instance.destination_location,
+                    product_id=instance.product_id,
+                    location_id=instance.destination_location_id,
                     defaults={'quantity': 0}
                 )
                 
@@ -141,7 +142,6 @@ def create_count_items_for_received_order(sender, instance, **kwargs):
                 # Use order's delivery location if specified, or fall back to default
                 location = instance.delivery_location
                 if not location:
-                    from .models import Location
                     location = Location.objects.filter(is_storage=True, is_active=True).first()
                 
                 if location:
@@ -155,4 +155,121 @@ def create_count_items_for_received_order(sender, instance, **kwargs):
                         reference=f"Order #{instance.order_number}",
                         notes=f"Received from order #{instance.order_number}",
                         performed_by=instance.updated_by or instance.created_by
-                    ) 
\ No newline at end of file
+                    )
+
+
+@receiver(post_save, sender=Product)
+def update_product_search_document(sender, instance, **kwargs):
+    """
+    Refresh the full-text search document of a saved product.
+    
+    Rows loaded from fixtures are skipped; the update_search_documents
+    command fills in their documents.
+    
+    Args:
+        sender: The model class (Product)
+        instance: The Product instance
+        **kwargs: Additional keyword arguments
+    """
+    if kwargs.get('raw'):
+        return
+    Product.objects.filter(pk=instance.pk).update(search_document=Product.search_vector())
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Supplier)
+def update_related_product_search_documents(sender, instance, created, **kwargs):
+    """
+    Refresh the search documents of the products of a changed category or supplier.
+    
+    Their names are part of each product's search document; a new category
+    or supplier has no products yet.
+    
+    Args:
+        sender: The model class (Category or Supplier)
+        instance: The Category or Supplier instance
+        created: Boolean indicating if the instance was created
+        **kwargs: Additional keyword arguments
+    """
+    if not created and not kwargs.get('raw'):
+        instance.products.update(search_document=Product.search_vector())
+
+
+# Denormalized child counters: counted model -> (foreign key attname, parent model, counter field)
+COUNTERS = {
+    Product: (
+        ('category_id', Category, 'product_count'),
+        ('supplier_id', Supplier, 'product_count'),
+    ),
+    InventoryItem: (
+        ('location_id', Location, 'inventory_item_count'),
+    ),
+}
+
+
+def adjust_counter(model, pk, field, delta):
+    """
+    Add delta to a counter field of one row, in the database.
+    """
+    if pk is not None:
+        model.objects.filter(pk=pk).update(**{field: F(field) + delta})
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=InventoryItem)
+def update_parent_counters(sender, instance, created, **kwargs):
+    """
+    Count a new row towards its parents, or move it when a parent changed.
+    
+    The previous parents are the ones the instance was loaded or last saved
+    with, so no query is needed to find them. Rows loaded from fixtures are
+    skipped; the recount command sets their counters.
+    
+    Args:
+        sender: The model class (Product or InventoryItem)
+        instance: The saved instance
+        created: Boolean indicating if the instance was created
+        **kwargs: Additional keyword arguments
+    """
+    if kwargs.get('raw'):
+        return
+    previous = getattr(instance, '_db_values', None)
+    if previous is None:
+        previous = instance._db_values = {}
+    for attname, parent, field in COUNTERS[sender]:
+        pk = getattr(instance, attname)
+        if created:
+            adjust_counter(parent, pk, field, 1)
+        elif attname in previous and previous[attname] != pk:
+            adjust_counter(parent, previous[attname], field, -1)
+            adjust_counter(parent, pk, field, 1)
+        previous[attname] = pk
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=InventoryItem)
+def decrement_parent_counters(sender, instance, **kwargs):
+    """
+    Stop counting a deleted row towards its parents.
+    
+    Args:
+        sender: The model class (Product or InventoryItem)
+        instance: The deleted instance
+        **kwargs: Additional keyword arguments
+    """
+    for attname, parent, field in COUNTERS[sender]:
+        adjust_counter(parent, getattr(instance, attname), field, -1)
+
+
+def create_trigram_extension(sender, using, **kwargs):
+    """
+    Ensure the pg_trgm extension exists before any inventory table is created.
+    
+    The trigram GIN indexes on inventory models need it, and tables of apps
+    without migrations (as under the test settings) are created before any
+    migration that could install it has run. Connected in InventoryConfig.ready().
+    """
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
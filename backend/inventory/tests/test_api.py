@@ -1,9 +1,15 @@
 """
 Tests for the inventory app API endpoints.
 """
+import json
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
-from inventory.models import Category, Supplier, Location
+from rest_framework.test import APITransactionTestCase
+from accounts.models import User
+from inventory.models import (
+    Category, Supplier, Location, Product, InventoryItem, InventoryCount, InventoryCountItem
+)
 from core.tests.test_base import BaseAPITestCase
 
 
@@ -143,6 +149,49 @@ class CategoryAPITests(BaseAPITestCase):
         # Verify category still exists and is active
         self.category.refresh_from_db()
         self.assertTrue(self.category.is_active)
+    
+    def test_retrieve_category_is_cached_until_saved(self):
+        """Test that a cached category response is dropped when the category is saved."""
+        self.authenticate_as_regular_user()
+        self.client.get(self.category_detail_url)
+        
+        # Cached: the database isn't queried for the category again
+        with self.assertNumQueries(0):
+            response = self.client.get(self.category_detail_url)
+        self.assertEqual(response.data['name'], self.category.name)
+        
+        self.category.description = 'Changed outside the API'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.save()
+        
+        response = self.client.get(self.category_detail_url)
+        
+        self.assertEqual(response.data['description'], 'Changed outside the API')
+    
+    def test_list_categories_is_dropped_when_products_change(self):
+        """Test that saving a product drops the cached, product-filtered category list."""
+        self.authenticate_as_regular_user()
+        with self.captureOnCommitCallbacks(execute=True):
+            category = Category.objects.create(name='Cache Category')
+        
+        response = self.client.get(self.category_list_url, {'has_products': 'false', 'search': 'Cache Category'})
+        self.assertEqual([row['id'] for row in response.data['results']], [category.id])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.create(
+                name='Cache Product',
+                sku='CACHE-001',
+                category=category,
+                supplier=Supplier.objects.first(),
+                unit_price=10.00,
+                unit_size=750,
+                unit_type='bottle'
+            )
+        
+        response = self.client.get(self.category_list_url, {'has_products': 'false', 'search': 'Cache Category'})
+        self.assertEqual(response.data['results'], [])
+        response = self.client.get(self.category_list_url, {'has_products': 'true', 'search': 'Cache Category'})
+        self.assertEqual([row['id'] for row in response.data['results']], [category.id])
 
 
 class SupplierAPITests(BaseAPITestCase):
@@ -299,4 +348,231 @@ class LocationAPITests(BaseAPITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['name'], "UniqueSearchableName") 
\ No newline at end of file
+        self.assertEqual(response.data['results'][0]['name'], "UniqueSearchableName")
+
+
+class ProductAPITests(BaseAPITestCase):
+    """Tests for the Product API endpoints."""
+    
+    def setUp(self):
+        """Set up for test case."""
+        super().setUp()
+        self.product_list_url = reverse('api:product-list')
+    
+    def test_search_products_by_partial_sku(self):
+        """Test that searching matches part of a product's SKU."""
+        self.authenticate_as_regular_user()
+        
+        response = self.client.get(self.product_list_url, {'search': 'VOD-TTO'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['sku'], 'SPRT-VOD-TTO-750')
+    
+    def test_search_products_by_partial_category_name(self):
+        """Test that searching matches part of a product's category name."""
+        self.authenticate_as_regular_user()
+        product = Product.objects.select_related('category').first()
+        
+        response = self.client.get(self.product_list_url, {'search': product.category.name[1:-1]})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(product.id, [row['id'] for row in response.data['results']])
+
+
+class InventoryItemAPITests(BaseAPITestCase):
+    """Tests for the InventoryItem API endpoints."""
+    
+    def setUp(self):
+        """Set up for test case."""
+        super().setUp()
+        self.inventory_item_list_url = reverse('api:inventoryitem-list')
+        self.inventory_item_export_url = reverse('api:inventoryitem-export')
+    
+    def test_export_inventory_items(self):
+        """Test that the export streams every inventory item as a JSON line."""
+        self.authenticate_as_regular_user()
+        
+        response = self.client.get(self.inventory_item_export_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), InventoryItem.objects.count())
+        item = InventoryItem.objects.select_related('product', 'location').get(id=rows[0]['id'])
+        self.assertEqual(rows[0]['product_name'], item.product.name)
+        self.assertEqual(rows[0]['location_name'], item.location.name)
+    
+    def test_create_duplicate_inventory_item(self):
+        """Test that a second item for a product and location is a 400 on product_id."""
+        self.authenticate_as_admin()
+        item = InventoryItem.objects.first()
+        
+        response = self.client.post(self.inventory_item_list_url, {
+            'product_id': item.product_id,
+            'location_id': item.location_id,
+            'quantity': 1,
+        })
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data,
+            {'product_id': ['An inventory item for this product and location already exists.']}
+        )
+    
+    def test_create_inventory_item_with_unknown_location(self):
+        """Test that an unknown location id is a 400 on the location_id field."""
+        self.authenticate_as_admin()
+        
+        response = self.client.post(self.inventory_item_list_url, {
+            'product_id': Product.objects.first().id,
+            'location_id': 999999,
+            'quantity': 1,
+        })
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'location_id': ['A referenced object does not exist.']})
+
+
+class ForeignKeyIdAPITests(APITransactionTestCase):
+    """
+    Tests for writes through unknown related ids outside a test transaction.
+    
+    The foreign key constraints are deferred, so these run against committed
+    writes, as requests do.
+    """
+    
+    fixtures = [
+        'accounts/fixtures/admin_user.json',
+        'inventory/fixtures/categories.json',
+        'inventory/fixtures/suppliers.json',
+        'inventory/fixtures/locations.json',
+        'inventory/fixtures/products.json',
+    ]
+    
+    def setUp(self):
+        """Set up for each test method."""
+        self.client.force_authenticate(user=User.objects.get(username='admin'))
+        cache.clear()
+    
+    def test_create_inventory_item_with_unknown_product(self):
+        """Test that an unknown product id is a 400 on the product_id field."""
+        response = self.client.post(reverse('api:inventoryitem-list'), {
+            'product_id': 999999,
+            'location_id': Location.objects.first().id,
+            'quantity': 1,
+        })
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'product_id': ['A referenced object does not exist.']})
+        self.assertFalse(InventoryItem.objects.filter(product_id=999999).exists())
+    
+    def test_create_inventory_count_with_unknown_location(self):
+        """Test that an unknown location id is a 400 on the location field."""
+        response = self.client.post(reverse('api:inventorycount-list'), {
+            'name': 'Unknown Location Count',
+            'location': 999999,
+        })
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'location': ['A referenced object does not exist.']})
+        self.assertFalse(InventoryCount.objects.exists())
+
+
+class InventoryCountAPITests(BaseAPITestCase):
+    """Tests for the InventoryCount API endpoints."""
+    
+    def setUp(self):
+        """Set up for test case."""
+        super().setUp()
+        self.inventory_count_list_url = reverse('api:inventorycount-list')
+        self.location = Location.objects.first()
+        self.inventory_count = InventoryCount.objects.create(
+            name='Test Count',
+            location=self.location,
+            created_by=self.admin_user
+        )
+        self.count_items_url = reverse('api:inventorycount-count-items', args=[self.inventory_count.id])
+        products = Product.objects.all()[:2]
+        InventoryCountItem.objects.create(
+            inventory_count=self.inventory_count,
+            product=products[0],
+            expected_quantity=5,
+            counted_quantity=5,
+            is_counted=True
+        )
+        self.uncounted_item = InventoryCountItem.objects.create(
+            inventory_count=self.inventory_count,
+            product=products[1],
+            expected_quantity=3
+        )
+    
+    def test_list_inventory_counts(self):
+        """Test that listed counts refer to related objects by id and report progress."""
+        self.authenticate_as_regular_user()
+        
+        response = self.client.get(self.inventory_count_list_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        count = response.data['results'][0]
+        self.assertEqual(count['location'], self.location.id)
+        self.assertEqual(count['location_name'], self.location.name)
+        self.assertEqual(count['created_by'], self.admin_user.id)
+        self.assertEqual(count['created_by_username'], self.admin_user.username)
+        self.assertIsNone(count['completed_by'])
+        self.assertEqual(count['status_display'], 'In Progress')
+        self.assertEqual(count['total_items'], 2)
+        self.assertEqual(count['completed_items'], 1)
+        self.assertEqual(count['progress_percentage'], 50)
+    
+    def test_create_inventory_count_by_location_id(self):
+        """Test that a count is created from a location id and belongs to the requesting user."""
+        self.authenticate_as_admin()
+        
+        response = self.client.post(self.inventory_count_list_url, {
+            'name': 'Created Count',
+            'location': self.location.id,
+        })
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['location'], self.location.id)
+        self.assertEqual(response.data['created_by'], self.admin_user.id)
+        count = InventoryCount.objects.get(name='Created Count')
+        self.assertEqual(count.location_id, self.location.id)
+        self.assertEqual(count.created_by_id, self.admin_user.id)
+    
+    def test_count_items(self):
+        """Test that several items are counted in one request."""
+        self.authenticate_as_admin()
+        
+        response = self.client.patch(
+            self.count_items_url,
+            [{
+                'id': self.uncounted_item.id,
+                'counted_quantity': 2,
+                'is_counted': True,
+                'counted_by': self.admin_user.id,
+            }],
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.uncounted_item.refresh_from_db()
+        self.assertTrue(self.uncounted_item.is_counted)
+        self.assertEqual(self.uncounted_item.counted_quantity, 2)
+    
+    def test_count_items_with_invalid_ids(self):
+        """Test that ids which aren't integers are a 400, not a server error."""
+        self.authenticate_as_admin()
+        
+        for invalid_id in ([self.uncounted_item.id], {'id': self.uncounted_item.id}, True):
+            with self.subTest(id=invalid_id):
+                response = self.client.patch(
+                    self.count_items_url,
+                    [{'id': invalid_id, 'counted_quantity': 2, 'is_counted': True}],
+                    format='json'
+                )
+                
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('id', response.data[0])
@@ -1,10 +1,15 @@
 """
 Tests for the inventory app models.
 """
+from io import StringIO
 from django.test import TestCase
-from django.db import IntegrityError
+from django.core.management import call_command
+from django.test.utils import CaptureQueriesContext
+from django.db import IntegrityError, connection
+from django.db.models import Sum
 from django.core.exceptions import ValidationError
-from inventory.models import Category, Supplier, Location, Product
+from django.contrib.postgres.search import SearchQuery
+from inventory.models import Category, Supplier, Location, Product, InventoryItem
 from core.tests.test_base import BaseTestCase
 
 
@@ -270,4 +275,174 @@ class LocationModelTests(BaseTestCase):
         # Total value should be (5 * 10.00) + (3 * 20.00) = 50 + 60 = 110
         total_value = sum(item.total_value for item in location.inventory_items.all())
         
-        self.assertEqual(total_value, 110.0) 
\ No newline at end of file
+        self.assertEqual(total_value, 110.0)
+
+
+class ProductSearchDocumentTests(BaseTestCase):
+    """Tests for the Product full-text search document."""
+    
+    def setUp(self):
+        """Create a product to search for."""
+        self.supplier = Supplier.objects.create(name="Highland Imports")
+        self.category = Category.objects.create(name="Whisky")
+        self.product = Product.objects.create(
+            name="Glen Reserve",
+            sku="GR-12",
+            description="Twelve year single malt",
+            category=self.category,
+            supplier=self.supplier,
+            unit_price=45.00,
+            unit_size=750,
+            unit_type="bottle"
+        )
+    
+    def search(self, value):
+        """Return the products whose search document matches the value."""
+        return Product.objects.filter(
+            search_document=SearchQuery(value, config=Product.SEARCH_CONFIG, search_type="websearch")
+        )
+    
+    def test_search_document_set_on_save(self):
+        """Test the product's own fields and related names are searchable."""
+        self.assertIn(self.product, self.search("malt"))
+        self.assertIn(self.product, self.search("whisky"))
+        self.assertIn(self.product, self.search("highland"))
+    
+    def test_search_document_follows_category_rename(self):
+        """Test renaming the category refreshes its products' search documents."""
+        self.category.name = "Scotch"
+        self.category.save()
+        
+        self.assertIn(self.product, self.search("scotch"))
+        self.assertNotIn(self.product, self.search("whisky"))
+
+
+class ProductCountTests(BaseTestCase):
+    """Tests for the denormalized product counters."""
+    
+    def setUp(self):
+        """Create a category and supplier without products."""
+        self.supplier = Supplier.objects.create(name="Counter Supplier")
+        self.category = Category.objects.create(name="Counter Category")
+        self.other_category = Category.objects.create(name="Other Counter Category")
+    
+    def create_product(self, **kwargs):
+        """Create a product in the test category."""
+        return Product.objects.create(
+            name="Counted Product",
+            category=self.category,
+            supplier=self.supplier,
+            unit_price=10.00,
+            unit_size=750,
+            unit_type="bottle",
+            **kwargs
+        )
+    
+    def assertProductCount(self, obj, expected):
+        """Assert the stored product count of a category or supplier."""
+        obj.refresh_from_db(fields=["product_count"])
+        self.assertEqual(obj.product_count, expected)
+    
+    def test_product_count_follows_creation_and_deletion(self):
+        """Test creating and deleting products updates the counters."""
+        product = self.create_product(sku="CNT-1")
+        self.create_product(sku="CNT-2")
+        
+        self.assertProductCount(self.category, 2)
+        self.assertProductCount(self.supplier, 2)
+        
+        product.delete()
+        
+        self.assertProductCount(self.category, 1)
+        self.assertProductCount(self.supplier, 1)
+    
+    def test_product_count_follows_category_change(self):
+        """Test moving a product to another category moves its count."""
+        product = self.create_product(sku="CNT-3")
+        
+        product.category = self.other_category
+        product.save()
+        
+        self.assertProductCount(self.category, 0)
+        self.assertProductCount(self.other_category, 1)
+        self.assertProductCount(self.supplier, 1)
+    
+    def test_product_count_follows_category_change_of_loaded_product(self):
+        """Test moving a product read from the database moves its count without reading it again."""
+        product = Product.objects.get(pk=self.create_product(sku="CNT-5").pk)
+        
+        product.category = self.other_category
+        with CaptureQueriesContext(connection) as queries:
+            product.save()
+        
+        self.assertFalse([query for query in queries if query['sql'].startswith('SELECT')])
+        self.assertProductCount(self.category, 0)
+        self.assertProductCount(self.other_category, 1)
+    
+    def test_raw_saves_leave_counters_alone(self):
+        """Test rows saved by loaddata don't change the counters."""
+        product = Product(
+            name="Fixture Product",
+            sku="CNT-6",
+            category=self.category,
+            supplier=self.supplier,
+            unit_price=10.00,
+            unit_size=750,
+            unit_type="bottle"
+        )
+        product.save_base(raw=True)
+        
+        self.assertProductCount(self.category, 0)
+        self.assertProductCount(self.supplier, 0)
+    
+    def test_recount_restores_counters(self):
+        """Test the recount command sets the counters from the rows."""
+        self.create_product(sku="CNT-4")
+        Category.objects.filter(pk=self.category.pk).update(product_count=0)
+        Supplier.objects.filter(pk=self.supplier.pk).update(product_count=5)
+        
+        call_command("recount", stdout=StringIO())
+        
+        self.assertProductCount(self.category, 1)
+        self.assertProductCount(self.supplier, 1)
+        self.assertProductCount(self.other_category, 0)
+
+
+class ProductTotalQuantityTests(BaseTestCase):
+    """Tests for the product stock totals."""
+    
+    def setUp(self):
+        """Create a product stocked at two locations."""
+        self.product = Product.objects.create(
+            name="Stocked Product",
+            sku="STK-001",
+            category=Category.objects.create(name="Stock Category"),
+            supplier=Supplier.objects.create(name="Stock Supplier"),
+            unit_price=10.00,
+            unit_size=750,
+            unit_type="bottle",
+            par_level=20,
+            reorder_point=10
+        )
+        for name, quantity in (("Stock Bar", 4), ("Stock Cellar", 8)):
+            InventoryItem.objects.create(
+                product=self.product,
+                location=Location.objects.create(name=name),
+                quantity=quantity
+            )
+    
+    def test_total_quantity_sums_inventory_items(self):
+        """Test the total quantity is summed for plain instances."""
+        self.assertEqual(self.product.total_quantity, 12)
+        self.assertTrue(self.product.below_par_level)
+        self.assertFalse(self.product.needs_reorder)
+    
+    def test_annotated_total_quantity_is_used(self):
+        """Test an annotated total quantity replaces the per-product sum."""
+        product = Product.objects.annotate(
+            total_quantity=Sum("inventory_items__quantity")
+        ).get(pk=self.product.pk)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(product.total_quantity, 12)
+            self.assertEqual(product.total_value, 120)